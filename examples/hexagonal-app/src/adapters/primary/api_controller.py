@@ -1,10 +1,12 @@
-from dataclasses import dataclass
-from decimal import Decimal
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, fields
 
 from src.ports.inbound.catalog_use_case import CatalogUseCase
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductDTO:
     """Data Transfer Object for API responses."""
 
@@ -14,11 +16,51 @@ class ProductDTO:
     available: bool
 
 
+# Product attribute copied into each ProductDTO field.
+_DTO_SOURCES = {"id": "id", "name": "name", "price": "price_str", "available": "available"}
+
+
+def _compile_builders() -> tuple[Callable[..., ProductDTO], Callable[..., list[ProductDTO]]]:
+    """Generate DTO builders specialised to the Product -> ProductDTO mapping.
+
+    The schema is fixed at import time, so the attribute reads are emitted
+    as straight-line code and the DTO is built with positional arguments.
+    """
+    if [f.name for f in fields(ProductDTO)] != list(_DTO_SOURCES):
+        raise TypeError("_DTO_SOURCES is out of sync with ProductDTO")
+    args = ", ".join(f"p.{attr}" for attr in _DTO_SOURCES.values())
+    src = (
+        f"def build_dto(p):\n    return ProductDTO({args})\n"
+        f"def build_dto_list(products):\n    return [ProductDTO({args}) for p in products]\n"
+    )
+    namespace: dict[str, object] = {"ProductDTO": ProductDTO}
+    exec(src, namespace)
+    return namespace["build_dto"], namespace["build_dto_list"]  # type: ignore[return-value]
+
+
+_build_dto, _build_dto_list = _compile_builders()
+
+
+_PRICE_RE = re.compile(r"([0-9]+)(?:\.([0-9]{1,2}))?")
+
+
+def _parse_price_cents(value: str) -> int:
+    """Parse a price such as "19.99" into integer cents without going through Decimal."""
+    match = _PRICE_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid price: {value!r}")
+    whole, frac = match.groups()
+    return int(whole) * 100 + int((frac or "").ljust(2, "0"))
+
+
 class ProductController:
     """Primary adapter - REST API controller.
 
     This adapter receives HTTP requests and translates them to
     use case calls via the inbound port (CatalogUseCase).
+
+    Product IDs are interned on the way in; the repository interns the keys
+    it stores, so its dict lookups succeed on the identity check.
     """
 
     def __init__(self, catalog: CatalogUseCase) -> None:
@@ -26,35 +68,34 @@ class ProductController:
 
     def get_product(self, product_id: str) -> ProductDTO | None:
         """GET /products/{id}"""
-        product = self._catalog.get_product(product_id)
+        product = self._catalog.get_product(sys.intern(product_id))
         if not product:
             return None
-        return ProductDTO(
-            id=product.id,
-            name=product.name,
-            price=str(product.price),
-            available=product.is_available(),
-        )
+        return _build_dto(product)
+
+    def get_product_json(self, product_id: str) -> bytes | None:
+        """GET /products/{id}, encoded as the JSON response body."""
+        product = self._catalog.get_product(sys.intern(product_id))
+        if not product:
+            return None
+        return product.to_json()
+
+    def get_products(self, product_ids: list[str]) -> list[ProductDTO]:
+        """GET /products?ids=..."""
+        return _build_dto_list(self._catalog.get_products([sys.intern(i) for i in product_ids]))
 
     def list_products(self) -> list[ProductDTO]:
         """GET /products"""
+        return _build_dto_list(self._catalog.list_available_products())
+
+    def list_products_json(self) -> bytes:
+        """GET /products, encoded as the JSON response body."""
+        # Each product caches its own encoded form, so this is a byte join
         products = self._catalog.list_available_products()
-        return [
-            ProductDTO(
-                id=p.id,
-                name=p.name,
-                price=str(p.price),
-                available=p.is_available(),
-            )
-            for p in products
-        ]
+        return b"[" + b",".join([p.to_json() for p in products]) + b"]"
 
     def update_price(self, product_id: str, new_price: str) -> ProductDTO:
         """PATCH /products/{id}/price"""
-        product = self._catalog.update_product_price(product_id, Decimal(new_price))
-        return ProductDTO(
-            id=product.id,
-            name=product.name,
-            price=str(product.price),
-            available=product.is_available(),
-        )
+        cents = _parse_price_cents(new_price)
+        product = self._catalog.update_product_price(sys.intern(product_id), cents)
+        return _build_dto(product)
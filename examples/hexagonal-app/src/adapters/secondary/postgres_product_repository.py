@@ -1,4 +1,6 @@
-from decimal import Decimal
+import sys
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
 
 from src.domain.product import Product
 from src.ports.outbound.product_repository import ProductRepository
@@ -11,34 +13,103 @@ class PostgresProductRepository(ProductRepository):
     handles the actual database operations.
     """
 
+    by_id_cache_size = 10_000
+
     def __init__(self, connection_string: str) -> None:
         self._connection_string = connection_string
         # In a real app, this would initialize a database connection
         self._products: dict[str, Product] = {}
+        # LRU cache in front of the per-ID query
+        self._by_id_cache: OrderedDict[str, Product] = OrderedDict()
+        # Read-through cache for find_all(), dropped on every write.
+        # A tuple, so a caller can't mutate the shared snapshot.
+        # Availability is never cached: Product.reduce_stock() changes stock
+        # without going through this repository.
+        self._all_cache: tuple[Product, ...] | None = None
 
     def find_by_id(self, product_id: str) -> Product | None:
         """Find a product by ID from the database."""
+        cache = self._by_id_cache
+        product = cache.get(product_id)
+        if product is not None:
+            cache.move_to_end(product_id)
+            return product
         # Simulated database query
-        return self._products.get(product_id)
+        product = self._products.get(product_id)
+        if product is not None:
+            self._cache_by_id(product)
+        return product
+
+    def find_many(self, product_ids: list[str]) -> list[Product]:
+        """Find several products by ID in a single query."""
+        # Simulated SELECT ... WHERE id = ANY($1)
+        products = self._products
+        return [products[i] for i in product_ids if i in products]
 
-    def find_all(self) -> list[Product]:
+    def find_all(self) -> Sequence[Product]:
         """Find all products from the database."""
-        return list(self._products.values())
+        if self._all_cache is None:
+            # tuple() sizes itself from the dict view in one allocation
+            self._all_cache = tuple(self._products.values())
+        return self._all_cache
 
-    def find_available(self) -> list[Product]:
+    def find_available(self) -> Sequence[Product]:
         """Find all available products from the database."""
-        return [p for p in self._products.values() if p.is_available()]
+        # Simulated SELECT ... WHERE stock > 0; `available` tracks stock on every write
+        return [p for p in self._products.values() if p.available]
+
+    def iter_all(self) -> Iterator[Product]:
+        """Iterate all products without building a list."""
+        return iter(self._products.values())
+
+    def iter_available(self) -> Iterator[Product]:
+        """Iterate available products without building a list."""
+        return (p for p in self._products.values() if p.available)
 
     def save(self, product: Product) -> Product:
         """Save a product to the database."""
+        # Interned so lookups with interned IDs match on identity
+        product.id = sys.intern(product.id)
         # Simulated database save
         self._products[product.id] = product
+        self._cache_by_id(product)
+        self._invalidate_lists()
+        return product
+
+    def update_price(self, product_id: str, new_price_cents: int) -> Product | None:
+        """Update a product's price in a single statement."""
+        # Simulated UPDATE products SET price_cents = $1 WHERE id = $2 RETURNING *
+        product = self._products.get(product_id)
+        if product is None:
+            return None
+        product.price_cents = new_price_cents
+        # Price doesn't change which products exist, so the find_all() cache
+        # (which holds the same objects) stays valid.
+        self._cache_by_id(product)
         return product
 
     def seed_data(self) -> None:
         """Seed initial data for testing."""
+        # ID literals are already interned by the compiler
         self._products = {
-            "1": Product(id="1", name="Widget", price=Decimal("19.99"), stock=100),
-            "2": Product(id="2", name="Gadget", price=Decimal("49.99"), stock=50),
-            "3": Product(id="3", name="Gizmo", price=Decimal("29.99"), stock=0),
+            "1": Product(id="1", name="Widget", price_cents=1999, stock=100),
+            "2": Product(id="2", name="Gadget", price_cents=4999, stock=50),
+            "3": Product(id="3", name="Gizmo", price_cents=2999, stock=0),
         }
+        self._by_id_cache.clear()
+        self._invalidate_lists()
+
+    def invalidate(self, product_id: str) -> None:
+        """Drop a cached product after it was changed outside this repository."""
+        self._by_id_cache.pop(product_id, None)
+        self._invalidate_lists()
+
+    def _cache_by_id(self, product: Product) -> None:
+        cache = self._by_id_cache
+        cache[product.id] = product
+        cache.move_to_end(product.id)
+        if len(cache) > self.by_id_cache_size:
+            cache.popitem(last=False)
+
+    def _invalidate_lists(self) -> None:
+        self._all_cache = None
@@ -1,19 +1,54 @@
-from dataclasses import dataclass
-from decimal import Decimal
+import json
+from dataclasses import dataclass, field
+from typing import Any
 
 
-@dataclass
+def format_price(cents: int) -> str:
+    """Format an amount in cents as a decimal string, e.g. 1999 -> "19.99"."""
+    units, rest = divmod(cents, 100)
+    return f"{units}.{rest:02d}"
+
+
+_encoder = json.JSONEncoder(separators=(",", ":"))
+
+
+@dataclass(slots=True)
 class Product:
-    """Domain entity representing a product."""
+    """Domain entity representing a product.
+
+    Prices are held as integer cents. ``price_str`` and ``available`` are
+    derived from ``price_cents`` and ``stock`` and recomputed whenever those
+    are assigned, so read-heavy callers don't format the price or compare
+    stock on every read. The JSON form is encoded on first use and dropped
+    on any later assignment.
+    """
 
     id: str
     name: str
-    price: Decimal
+    price_cents: int
     stock: int
+    price_str: str = field(init=False, repr=False, compare=False)
+    available: bool = field(init=False, repr=False, compare=False)
+    _json: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == "price_cents":
+            object.__setattr__(self, "price_str", format_price(value))
+        elif name == "stock":
+            object.__setattr__(self, "available", value > 0)
+        object.__setattr__(self, "_json", None)
+
+    def to_json(self) -> bytes:
+        """Return the product's public JSON representation, cached until the next write."""
+        if self._json is None:
+            payload = {"id": self.id, "name": self.name, "price": self.price_str, "available": self.available}
+            object.__setattr__(self, "_json", _encoder.encode(payload).encode())
+        return self._json  # type: ignore[return-value]
 
     def is_available(self) -> bool:
         """Check if product is in stock."""
-        return self.stock > 0
+        return self.available
 
     def reduce_stock(self, quantity: int) -> None:
         """Reduce stock after a purchase."""
@@ -1,5 +1,3 @@
-from decimal import Decimal
-
 from src.domain.product import Product
 from src.ports.outbound.product_repository import ProductRepository
 
@@ -17,14 +15,16 @@ class ProductService:
         """Get a product by ID."""
         return self._repository.find_by_id(product_id)
 
-    def update_price(self, product_id: str, new_price: Decimal) -> Product:
-        """Update product price with business validation."""
-        if new_price <= 0:
+    def get_products(self, product_ids: list[str]) -> list[Product]:
+        """Get several products by ID in one repository call."""
+        return self._repository.find_many(product_ids)
+
+    def update_price(self, product_id: str, new_price_cents: int) -> Product:
+        """Update product price (in cents) with business validation."""
+        if new_price_cents <= 0:
             raise ValueError("Price must be positive")
 
-        product = self._repository.find_by_id(product_id)
+        product = self._repository.update_price(product_id, new_price_cents)
         if not product:
             raise ValueError(f"Product not found: {product_id}")
-
-        product.price = new_price
-        return self._repository.save(product)
+        return product
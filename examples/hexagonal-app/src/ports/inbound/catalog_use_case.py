@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from decimal import Decimal
+from collections.abc import Iterable
 
 from src.domain.product import Product
 
@@ -17,11 +17,20 @@ class CatalogUseCase(ABC):
         ...
 
     @abstractmethod
-    def list_available_products(self) -> list[Product]:
-        """List all products that are in stock."""
+    def get_products(self, product_ids: list[str]) -> list[Product]:
+        """Get several products in one call, skipping unknown IDs."""
         ...
 
     @abstractmethod
-    def update_product_price(self, product_id: str, new_price: Decimal) -> Product:
-        """Update the price of a product."""
+    def list_available_products(self) -> Iterable[Product]:
+        """List all products that are in stock.
+
+        Callers iterate the result once, so implementations may return a
+        generator instead of building a list.
+        """
+        ...
+
+    @abstractmethod
+    def update_product_price(self, product_id: str, new_price_cents: int) -> Product:
+        """Update the price of a product, given in cents."""
         ...
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from src.domain.product import Product
 
@@ -17,12 +18,17 @@ class ProductRepository(ABC):
         ...
 
     @abstractmethod
-    def find_all(self) -> list[Product]:
+    def find_many(self, product_ids: list[str]) -> list[Product]:
+        """Find several products by ID in one query, skipping unknown IDs."""
+        ...
+
+    @abstractmethod
+    def find_all(self) -> Sequence[Product]:
         """Find all products."""
         ...
 
     @abstractmethod
-    def find_available(self) -> list[Product]:
+    def find_available(self) -> Sequence[Product]:
         """Find all products that are in stock."""
         ...
 
@@ -30,3 +36,11 @@ class ProductRepository(ABC):
     def save(self, product: Product) -> Product:
         """Save a product (create or update)."""
         ...
+
+    @abstractmethod
+    def update_price(self, product_id: str, new_price_cents: int) -> Product | None:
+        """Set a product's price in one operation and return the updated product.
+
+        Returns None if no product has the given ID.
+        """
+        ...
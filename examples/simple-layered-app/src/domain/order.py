@@ -6,6 +6,8 @@ from typing import List
 class OrderItem:
     """An item in an order"""
 
+    __slots__ = ("product_id", "quantity", "price")
+
     def __init__(self, product_id: str, quantity: int, price: float):
         self.product_id = product_id
         self.quantity = quantity
@@ -18,6 +20,8 @@ class OrderItem:
 class Order:
     """Domain model for Order"""
 
+    __slots__ = ("order_id", "user_id", "items")
+
     def __init__(self, order_id: str, user_id: str):
         self.order_id = order_id
         self.user_id = user_id
@@ -3,6 +3,8 @@
 class User:
     """Domain model for User"""
 
+    __slots__ = ("user_id", "name", "email")
+
     def __init__(self, user_id: str, name: str, email: str):
         self.user_id = user_id
         self.name = name
@@ -0,0 +1,23 @@
+# UI/API Layer - JSON response encoding shared by the controllers
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+
+def _json_default(obj: object) -> str:
+    """Encode values the stdlib JSON encoder does not handle natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# One compact encoder for every endpoint
+_encode = json.JSONEncoder(separators=(",", ":"), default=_json_default).encode
+
+
+def json_body(payload: object) -> bytes:
+    """Encode an endpoint's payload as the JSON response body."""
+    return _encode(payload).encode()
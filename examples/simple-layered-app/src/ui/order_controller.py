@@ -1,6 +1,7 @@
 # UI/API Layer - HTTP endpoints
 
 from src.application.order_service import OrderService
+from src.ui.json_response import json_body
 
 
 class OrderController:
@@ -9,19 +10,19 @@ class OrderController:
     def __init__(self):
         self.service = OrderService()
 
-    def create_order_endpoint(self, request_data: dict) -> dict:
+    def create_order_endpoint(self, request_data: dict) -> bytes:
         """POST /orders endpoint"""
         order = self.service.create_order(
             order_id=request_data["order_id"],
             user_id=request_data["user_id"]
         )
-        return {
+        return json_body({
             "order_id": order.order_id,
             "user_id": order.user_id,
             "items": []
-        }
+        })
 
-    def add_item_endpoint(self, order_id: str, request_data: dict) -> dict:
+    def add_item_endpoint(self, order_id: str, request_data: dict) -> bytes:
         """POST /orders/{id}/items endpoint"""
         self.service.add_item_to_order(
             order_id=order_id,
@@ -30,7 +31,7 @@ class OrderController:
             price=request_data["price"]
         )
         total = self.service.get_order_total(order_id)
-        return {
+        return json_body({
             "order_id": order_id,
             "total": total
-        }
+        })
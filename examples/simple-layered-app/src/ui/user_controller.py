@@ -1,6 +1,7 @@
 # UI/API Layer - HTTP endpoints
 
 from src.application.user_service import UserService
+from src.ui.json_response import json_body
 
 # VIOLATION: UI layer should not directly access infrastructure
 # This is an architectural violation that Pacta will catch
@@ -15,24 +16,24 @@ class UserController:
         # VIOLATION: Direct database access from UI layer
         self.db = Database("postgresql://localhost:5432/myapp")
 
-    def create_user_endpoint(self, request_data: dict) -> dict:
+    def create_user_endpoint(self, request_data: dict) -> bytes:
         """POST /users endpoint"""
         user = self.service.create_user(
             user_id=request_data["id"],
             name=request_data["name"],
             email=request_data["email"]
         )
-        return {
+        return json_body({
             "user_id": user.user_id,
             "name": user.name,
             "email": user.email
-        }
+        })
 
-    def get_user_endpoint(self, user_id: str) -> dict:
+    def get_user_endpoint(self, user_id: str) -> bytes:
         """GET /users/{id} endpoint"""
         user = self.service.get_user(user_id)
-        return {
+        return json_body({
             "user_id": user.user_id,
             "name": user.name,
             "email": user.email
-        }
+        })
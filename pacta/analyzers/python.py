@@ -1,10 +1,19 @@
 import ast
+import hashlib
+import json
+import os
 import re
+import sys
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
+from pacta import PACTA_VERSION
 from pacta.ir.keys import dedupe_edges, dedupe_nodes
 from pacta.ir.types import (
     ArchitectureIR,
@@ -34,6 +43,192 @@ class _ImportHit:
     col_offset: int
 
 
+# Mixed into cache keys: parse results depend on the pacta and Python versions and
+# on how _parse_source decodes files (bump _CACHE_FORMAT when that changes)
+_CACHE_FORMAT = 3
+_CACHE_SALT = f"{PACTA_VERSION}|{sys.version_info.major}.{sys.version_info.minor}|{_CACHE_FORMAT}|".encode()
+
+_ImportRow = tuple[str, str | None, str | None, int, int, int]
+
+
+def _parse_imports(path: str, rel: str, cache_dir: str | None = None) -> tuple[str | None, list[_ImportHit] | None]:
+    """
+    Read and parse one file, returning (cache key, import hits).
+
+    Hits are None for files that can't be decoded or parsed.
+    Module-level (not a method) so it can be shipped to worker processes.
+
+    If cache_dir is set, results are cached there keyed by a hash of the
+    source bytes, so unchanged files are not re-parsed on later runs; the
+    key is None when no cache entry was involved. Files that never mention
+    "import" skip both the cache and the parser.
+    """
+    with open(path, "rb") as fh:
+        data = fh.read()
+
+    # Every import statement contains the keyword, so files without it
+    # (empty __init__.py, data/constant modules) have no hits to find
+    if b"import" not in data:
+        return None, []
+
+    if cache_dir is None:
+        return None, _parse_source(data, rel)
+
+    h = hashlib.sha256(_CACHE_SALT)
+    h.update(data)
+    digest = h.hexdigest()
+    cache_file = os.path.join(cache_dir, digest[:2], digest[2:])
+    try:
+        with open(cache_file, "rb") as fh:
+            return digest, _hits_from_rows(json.loads(fh.read()))
+    except Exception:
+        # Missing, corrupt or foreign entry: a miss, never an error
+        pass
+
+    hits = _parse_source(data, rel)
+    rows: list[_ImportRow] | None = None
+    if hits is not None:
+        rows = [(h.kind, h.module, h.name, h.level, h.lineno, h.col_offset) for h in hits]
+    _write_cache_entry(cache_file, json.dumps(rows, separators=(",", ":")).encode())
+    return digest, hits
+
+
+def _hits_from_rows(rows: object) -> list[_ImportHit] | None:
+    """
+    Import hits from a decoded cache entry (None for an unparseable file).
+
+    Entries live in the scanned tree, so they are plain JSON (never code) and
+    every row is type-checked; anything unexpected raises ValueError.
+    """
+    if rows is None:
+        return None
+    if not isinstance(rows, list):
+        raise ValueError("cache entry is not a list")
+
+    hits: list[_ImportHit] = []
+    for row in rows:
+        if not isinstance(row, list) or len(row) != 6:
+            raise ValueError("malformed cache row")
+        kind, module, name, level, lineno, col_offset = row
+        if (
+            kind not in ("import", "from")
+            or not (module is None or isinstance(module, str))
+            or not (name is None or isinstance(name, str))
+            or not all(type(v) is int for v in (level, lineno, col_offset))
+        ):
+            raise ValueError("malformed cache row")
+        hits.append(_ImportHit(kind, module, name, level, lineno, col_offset))
+    return hits
+
+
+def _parse_source(data: bytes, rel: str) -> list[_ImportHit] | None:
+    # ast.parse decodes bytes itself (honouring BOM and PEP 263 coding cookies),
+    # so there is no separate str copy of the file
+    try:
+        tree = ast.parse(data, filename=rel)
+    except (SyntaxError, ValueError):
+        # undecodable bytes are a SyntaxError; older Pythons raise ValueError on NUL bytes
+        return None
+
+    return _collect_imports(tree)
+
+
+def _write_cache_entry(cache_file: str, payload: bytes) -> None:
+    """
+    Best-effort atomic write: the cache is an optimization, never an error source.
+    """
+    tmp = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp, cache_file)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _prune_cache(cache_dir: str, live: set[str]) -> None:
+    """
+    Best-effort removal of cache entries (and stray temp files) whose key is not in `live`.
+
+    Keeps the cache to the entries of the last full scan, so edited and
+    deleted files don't leave entries behind forever.
+    """
+    try:
+        subdirs = list(os.scandir(cache_dir))
+    except OSError:
+        return
+
+    for sub in subdirs:
+        try:
+            if not sub.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(sub.path) as entries:
+                stale = [e.path for e in entries if sub.name + e.name not in live]
+        except OSError:
+            continue
+        for path in stale:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+# Node types that can hold nested statements (try handlers, match cases)
+_STMT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _iter_statements(tree: ast.AST) -> Iterator[ast.AST]:
+    """
+    Breadth-first walk over statements only.
+
+    Imports are statements and expressions never contain statements, so this
+    visits imports in the same order as ast.walk() without touching the
+    (far more numerous) expression nodes.
+    """
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        yield node
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list) and value and isinstance(value[0], _STMT_CONTAINERS):
+                queue.extend(value)
+
+
+def _collect_imports(tree: ast.AST) -> list[_ImportHit]:
+    """
+    All import hits of a module, one per imported alias, in ast.walk() order.
+
+    Builds the list directly (no generator round-trip per alias) and
+    dispatches on the exact node type; the ast module's node classes are
+    never subclassed by the parser.
+    """
+    import_t = ast.Import
+    import_from_t = ast.ImportFrom
+    hits: list[_ImportHit] = []
+    append = hits.append
+    for n in _iter_statements(tree):
+        t = type(n)
+        if t is import_t:
+            lineno = getattr(n, "lineno", 1)
+            col_offset = getattr(n, "col_offset", 0)
+            for alias in n.names:
+                append(_ImportHit("import", None, alias.name, 0, lineno, col_offset))
+        elif t is import_from_t:
+            # n.module can be None (e.g., from . import x)
+            module = n.module
+            level = int(n.level or 0)
+            lineno = getattr(n, "lineno", 1)
+            col_offset = getattr(n, "col_offset", 0)
+            for alias in n.names:
+                append(_ImportHit("from", module, alias.name, level, lineno, col_offset))
+    return hits
+
+
 class PythonAnalyzer:
     """
     Python analyzer plugin.
@@ -42,8 +237,19 @@ class PythonAnalyzer:
     - module-level nodes from *.py files
     - module-level import edges
     - best-effort external nodes (no path/loc)
+
+    Files are parsed in a process pool once there are at least
+    _PARALLEL_MIN_FILES of them; smaller repos are parsed inline, where
+    worker startup would cost more than it saves. The worker count can be
+    set with language_options["python"]["jobs"] (1 disables the pool).
+
+    When AnalyzeConfig.cache_dir is set, per-file import results are cached
+    under <cache_dir>/python, keyed by the file's content hash. After a scan
+    of the whole repo (no include_paths), entries it didn't use are pruned.
     """
 
+    _PARALLEL_MIN_FILES = 64
+
     @property
     def language(self) -> Language:
         return Language.PYTHON
@@ -78,10 +284,9 @@ class PythonAnalyzer:
         if not repo_root.exists():
             return False
 
-        # very lightweight scan
-        for p in repo_root.rglob("*.py"):
-            if p.is_file() and not self._is_excluded(repo_root, p, self._DEFAULT_EXCLUDE_GLOBS):
-                return True
+        # very lightweight scan: same pruned walk as analyze(), stopping at the first hit
+        for _ in self._walk_python_files(repo_root, repo_root, "", self._DEFAULT_EXCLUDE_GLOBS, sys.maxsize):
+            return True
         return False
 
     def analyze(self, config: AnalyzeConfig) -> ArchitectureIR:
@@ -98,86 +303,82 @@ class PythonAnalyzer:
         # Stable code_root for CanonicalId: repo folder name (avoid machine-specific abs paths)
         code_root = repo_root.name
 
-        nodes: list[IRNode] = []
-        edges: list[IREdge] = []
-
-        file_to_mod: dict[Path, str] = {}
-
-        # 1) create module nodes (from files)
-        for f in py_files:
-            mod = self._module_fqname_from_path(repo_root, f)
-            file_to_mod[f] = mod
-            rel = f.relative_to(repo_root).as_posix()
-            nodes.append(
-                IRNode(
-                    id=CanonicalId(language=Language.PYTHON, code_root=code_root, fqname=mod),
-                    kind=SymbolKind.MODULE,
-                    name=mod.rsplit(".", 1)[-1] if mod else f.stem,
-                    path=rel,
-                    loc=SourceLoc(
-                        file=rel,
-                        start=SourcePos(line=1, column=1),
-                        end=None,
-                    ),
-                )
+        # Keyed as we go so duplicates are never built: nodes by module name,
+        # edges by (src module, dst module). language/code_root/dep_type are the
+        # same for every entry, so these keys match node_key/edge_key identity.
+        nodes: dict[str, IRNode] = {}
+        edges: dict[tuple[str, str], IREdge] = {}
+
+        # Every yielded file lives under the resolved repo_root (include paths are
+        # resolved once in _normalize_includes), so a plain string strip is enough.
+        root_prefix_len = len(str(repo_root).rstrip(os.sep)) + 1
+        rels = [str(f)[root_prefix_len:].replace(os.sep, "/") for f in py_files]
+        mods = [self._module_fqname_from_rel(rel) for rel in rels]
+
+        # 1) create module nodes (from files; first file wins for a module name)
+        for f, rel, mod in zip(py_files, rels, mods, strict=True):
+            if mod in nodes:
+                continue
+            nodes[mod] = IRNode(
+                id=CanonicalId(language=Language.PYTHON, code_root=code_root, fqname=mod),
+                kind=SymbolKind.MODULE,
+                name=mod.rpartition(".")[2] if mod else f.stem,
+                path=rel,
+                loc=SourceLoc(
+                    file=rel,
+                    start=SourcePos(line=1, column=1),
+                    end=None,
+                ),
             )
 
         # 2) parse imports and create edges (+ best-effort external module nodes)
-        for f in py_files:
-            rel = f.relative_to(repo_root).as_posix()
-            src_mod = file_to_mod.get(f) or self._module_fqname_from_path(repo_root, f)
-            src_id = CanonicalId(language=Language.PYTHON, code_root=code_root, fqname=src_mod)
-
-            try:
-                text = f.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                # skip unreadable file
+        cache_dir = None if config.cache_dir is None else str(config.cache_dir / "python")
+        parsed = self._parse_all([str(f) for f in py_files], rels, self._jobs(config), cache_dir)
+        if cache_dir is not None and not target.include_paths:
+            _prune_cache(cache_dir, {key for key, _ in parsed if key is not None})
+
+        for rel, src_mod, (_, hits) in zip(rels, mods, parsed, strict=True):
+            if hits is None:
+                # skip unreadable / invalid python file
                 continue
 
-            try:
-                tree = ast.parse(text, filename=rel)
-            except SyntaxError:
-                # skip invalid python file
-                continue
+            src_id = nodes[src_mod].id
 
-            for imp in self._iter_imports(tree):
+            for imp in hits:
                 dst_mod = self._resolve_import_target_module(src_mod, imp)
-                if not dst_mod:
+                if not dst_mod or (src_mod, dst_mod) in edges:
                     continue
 
-                dst_id = CanonicalId(language=Language.PYTHON, code_root=code_root, fqname=dst_mod)
-
-                # Ensure dependency node exists (may be external => path None)
-                nodes.append(
-                    IRNode(
-                        id=dst_id,
+                dst_node = nodes.get(dst_mod)
+                if dst_node is None:
+                    # Ensure dependency node exists (may be external => path None)
+                    dst_node = nodes[dst_mod] = IRNode(
+                        id=CanonicalId(language=Language.PYTHON, code_root=code_root, fqname=dst_mod),
                         kind=SymbolKind.MODULE,
-                        name=dst_mod.rsplit(".", 1)[-1],
+                        name=dst_mod.rpartition(".")[2],
                         path=None,
                         loc=None,
                     )
-                )
 
-                edges.append(
-                    IREdge(
-                        src=src_id,
-                        dst=dst_id,
-                        dep_type=DepType.IMPORT,
-                        loc=self._edge_loc(rel, imp.lineno, imp.col_offset),
-                        confidence=1.0,
-                        details={
-                            "kind": imp.kind,
-                            "module": imp.module,
-                            "name": imp.name,
-                            "level": imp.level,
-                        },
-                    )
+                edges[(src_mod, dst_mod)] = IREdge(
+                    src=src_id,
+                    dst=dst_node.id,
+                    dep_type=DepType.IMPORT,
+                    loc=self._edge_loc(rel, imp.lineno, imp.col_offset),
+                    confidence=1.0,
+                    details={
+                        "kind": imp.kind,
+                        "module": imp.module,
+                        "name": imp.name,
+                        "level": imp.level,
+                    },
                 )
 
-        # 3) deterministically dedupe + order
-        nodes_t = dedupe_nodes(nodes, deterministic=config.deterministic)
+        # 3) deterministically order (entries are already unique, so dedupe_* only
+        # computes each identity key once and sorts on it)
+        nodes_t = dedupe_nodes(nodes.values(), deterministic=config.deterministic)
         edges_t = dedupe_edges(
-            edges, include_location=False, include_details=False, deterministic=config.deterministic
+            edges.values(), include_location=False, include_details=False, deterministic=config.deterministic
         )
 
         return ArchitectureIR(
@@ -194,6 +395,31 @@ class PythonAnalyzer:
             },
         )
 
+    def _jobs(self, config: AnalyzeConfig) -> int:
+        opts = config.language_options.get(self.language.value) or {}
+        jobs = opts.get("jobs")
+        if jobs is None:
+            return os.cpu_count() or 1
+        return max(1, int(jobs))
+
+    def _parse_all(
+        self, paths: list[str], rels: list[str], jobs: int, cache_dir: str | None
+    ) -> list[tuple[str | None, list[_ImportHit] | None]]:
+        """
+        Parse files, in parallel when worthwhile. Results are in input order.
+        """
+        if jobs <= 1 or len(paths) < self._PARALLEL_MIN_FILES:
+            return [_parse_imports(p, r, cache_dir) for p, r in zip(paths, rels, strict=True)]
+
+        chunksize = max(1, len(paths) // (4 * jobs))
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                return list(pool.map(_parse_imports, paths, rels, repeat(cache_dir), chunksize=chunksize))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # process pools are unavailable on some platforms/sandboxes, and
+            # workers can die (OOM killer, missing __main__ guard on spawn)
+            return [_parse_imports(p, r, cache_dir) for p, r in zip(paths, rels, strict=True)]
+
     def _normalize_includes(self, repo_root: Path, target: AnalyzeTarget) -> tuple[Path, ...]:
         """
         If target.include_paths is empty -> analyze entire repo_root.
@@ -208,15 +434,17 @@ class PythonAnalyzer:
             if not pp.is_absolute():
                 pp = repo_root / pp
             pp = pp.resolve()
-            # safety: avoid scanning outside repo
-            try:
-                pp.relative_to(repo_root)
-            except Exception:
+            # safety: avoid scanning outside repo (checked once here, so the
+            # per-file code can rely on every path living under repo_root)
+            if not pp.is_relative_to(repo_root):
                 continue
             inc.append(pp)
         return tuple(inc) if inc else (repo_root,)
 
     def _merge_excludes(self, target: AnalyzeTarget) -> tuple[str, ...]:
+        # The default tuple itself, so _exclude_regexes() can use the prebuilt set
+        if not target.exclude_globs:
+            return self._DEFAULT_EXCLUDE_GLOBS
         globs = list(self._DEFAULT_EXCLUDE_GLOBS)
         globs.extend(list(target.exclude_globs or ()))
         return tuple(globs)
@@ -235,39 +463,134 @@ class PythonAnalyzer:
                         yield base
                 continue
 
-            if not base.exists():
+            if not base.is_dir():
                 continue
 
-            for f in base.rglob("*.py"):
-                if not f.is_file():
-                    continue
-                if self._is_excluded(repo_root, f, exclude_globs):
-                    continue
+            base_rel = base.relative_to(repo_root).as_posix()
+            yield from self._walk_python_files(
+                repo_root,
+                base,
+                "" if base_rel == "." else base_rel,
+                exclude_globs,
+                max_file_size_bytes,
+            )
+
+    def _walk_python_files(
+        self,
+        repo_root: Path,
+        base: Path,
+        base_rel: str,
+        exclude_globs: tuple[str, ...],
+        max_file_size_bytes: int,
+    ) -> Iterator[Path]:
+        """
+        os.scandir-based walk that never descends into excluded directories.
+
+        Repo-relative paths are built incrementally from entry names, so files
+        under a real directory need no resolve(). Like Path.rglob, symlinked
+        directories are not followed; symlinked files are kept only if they
+        resolve inside the repo.
+        """
+        prune = self._dir_prune_regexes(exclude_globs)
+        excludes = self._exclude_regexes(exclude_globs)
+        stack = [(str(base), base_rel)]
+        while stack:
+            dir_path, dir_rel = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            for entry in entries:
+                rel = f"{dir_rel}/{entry.name}" if dir_rel else entry.name
                 try:
-                    if f.stat().st_size > max_file_size_bytes:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not any(rx.match(rel) for rx in prune):
+                            stack.append((entry.path, rel))
+                        continue
+                    if not entry.name.endswith(".py") or not entry.is_file():
+                        continue
+                    if entry.is_symlink() and self._is_excluded(repo_root, Path(entry.path), exclude_globs):
+                        continue
+                    if any(rx.match(rel) for rx in excludes):
+                        continue
+                    if entry.stat().st_size > max_file_size_bytes:
                         continue
                 except OSError:
                     continue
-                yield f
+                yield Path(entry.path)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _dir_prune_regexes(cls, exclude_globs: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+        """
+        Directory matchers for globs of the form "<dir-pattern>/**".
+
+        If a directory matches <dir-pattern>, everything below it matches the
+        glob, so the whole subtree can be skipped. Other globs are only
+        checked against files.
+        """
+        out: list[re.Pattern[str]] = []
+        for g in exclude_globs:
+            gg = g.replace("\\", "/")
+            if gg.endswith("/**") and len(gg) > 3:
+                out.append(cls._glob_to_regex(gg[:-3]))
+        return tuple(out)
 
     def _is_excluded(self, repo_root: Path, path: Path, exclude_globs: tuple[str, ...]) -> bool:
         """
         Match repo-relative POSIX path against glob patterns supporting ** semantics.
 
         We avoid Path.match quirks and fnmatch limitations by translating globs to regex.
+        repo_root must already be resolved. Only used for explicit file includes and
+        symlinks; walked files go straight to _is_excluded_rel.
         """
-        try:
-            rel = path.resolve().relative_to(repo_root.resolve()).as_posix()
-        except Exception:
+        resolved = path.resolve()
+        if not resolved.is_relative_to(repo_root):
+            # e.g. a symlink pointing outside the repo
             return True
 
-        for g in exclude_globs:
-            gg = g.replace("\\", "/")
-            if self._glob_match(rel, gg):
+        return self._is_excluded_rel(resolved.relative_to(repo_root).as_posix(), exclude_globs)
+
+    def _is_excluded_rel(self, rel: str, exclude_globs: tuple[str, ...]) -> bool:
+        for rx in self._exclude_regexes(exclude_globs):
+            if rx.match(rel):
                 return True
 
         return False
 
+    def _exclude_regexes(self, exclude_globs: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+        # the default set is prebuilt at import time; skip the lru_cache lookup
+        # (which hashes the whole tuple) for it
+        if exclude_globs is self._DEFAULT_EXCLUDE_GLOBS:
+            return _DEFAULT_EXCLUDE_REGEXES
+        return self._compile_exclude_set(exclude_globs)
+
+    # Upper bound on the source size of one combined exclude regex
+    # (same guard Mercurial uses for large ignore files)
+    _MAX_EXCLUDE_RE_SIZE = 20_000
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _compile_exclude_set(cls, exclude_globs: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+        """
+        Combine exclude globs into anchored alternations: ^(?:g1|g2|...)$
+
+        One regex call per path instead of one per glob. Very large glob sets
+        are split into several alternations of bounded size.
+        """
+        chunks: list[list[str]] = []
+        size = 0
+        for g in exclude_globs:
+            body = cls._glob_regex_body(g.replace("\\", "/"))
+            if not chunks or size + len(body) + 1 > cls._MAX_EXCLUDE_RE_SIZE:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(body)
+            size += len(body) + 1
+        return tuple(re.compile("^(?:" + "|".join(chunk) + ")$") for chunk in chunks)
+
     @staticmethod
     @lru_cache(maxsize=2048)
     def _glob_to_regex(pattern: str) -> re.Pattern[str]:
@@ -278,10 +601,17 @@ class PythonAnalyzer:
           - ?   => [^/]
         The match is anchored (full string match).
         """
+        return re.compile("^" + PythonAnalyzer._glob_regex_body(pattern) + "$")
+
+    @staticmethod
+    def _glob_regex_body(pattern: str) -> str:
+        """
+        Unanchored regex source for a glob (see _glob_to_regex).
+        """
         # Build regex manually to handle ** specially
         i = 0
         n = len(pattern)
-        out: list[str] = ["^"]
+        out: list[str] = []
         while i < n:
             c = pattern[i]
             if c == "*":
@@ -310,16 +640,17 @@ class PythonAnalyzer:
             else:
                 out.append(re.escape(c))
                 i += 1
-        out.append("$")
-        return re.compile("".join(out))
+        return "".join(out)
 
     @classmethod
     def _glob_match(cls, rel_posix_path: str, pattern: str) -> bool:
         return cls._glob_to_regex(pattern).match(rel_posix_path) is not None
 
-    def _module_fqname_from_path(self, repo_root: Path, f: Path) -> str:
-        rel = f.resolve().relative_to(repo_root.resolve())
-        parts = list(rel.parts)
+    def _module_fqname_from_rel(self, rel: str) -> str:
+        """
+        Module name from a repo-relative POSIX path (no filesystem access).
+        """
+        parts = rel.split("/")
 
         # strip ".py"
         if parts and parts[-1].endswith(".py"):
@@ -330,34 +661,10 @@ class PythonAnalyzer:
             parts = parts[:-1]
 
         if not parts:
-            return f.stem
+            return rel.rsplit("/", 1)[-1][:-3]
 
         return ".".join(parts)
 
-    def _iter_imports(self, tree: ast.AST) -> Iterator[_ImportHit]:
-        for n in ast.walk(tree):
-            if isinstance(n, ast.Import):
-                for alias in n.names:
-                    yield _ImportHit(
-                        kind="import",
-                        module=None,
-                        name=alias.name,
-                        level=0,
-                        lineno=getattr(n, "lineno", 1),
-                        col_offset=getattr(n, "col_offset", 0),
-                    )
-            elif isinstance(n, ast.ImportFrom):
-                # n.module can be None (e.g., from . import x)
-                for alias in n.names:
-                    yield _ImportHit(
-                        kind="from",
-                        module=n.module,
-                        name=alias.name,
-                        level=int(n.level or 0),
-                        lineno=getattr(n, "lineno", 1),
-                        col_offset=getattr(n, "col_offset", 0),
-                    )
-
     def _resolve_import_target_module(self, src_module: str, imp: _ImportHit) -> str | None:
         """
         Resolve the *module* dependency target (module-level graph).
@@ -393,13 +700,18 @@ class PythonAnalyzer:
 
         return None
 
-    def _resolve_relative_base(self, src_module: str, level: int, module: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _resolve_relative_base(src_module: str, level: int, module: str) -> str:
         """
         Resolve relative import base.
 
         Example:
           src_module="a.b.c"
           from ..x import y  (level=2, module="x") => "a.x"
+
+        Pure string function; memoized since sibling modules repeat the same
+        relative imports.
         """
         src_parts = src_module.split(".") if src_module else []
         cut = max(0, len(src_parts) - level)
@@ -414,3 +726,7 @@ class PythonAnalyzer:
             start=SourcePos(line=max(1, int(lineno)), column=max(1, int(col_offset) + 1)),
             end=None,
         )
+
+
+# Prebuilt at import so the default excludes never hit a cold cache
+_DEFAULT_EXCLUDE_REGEXES = PythonAnalyzer._compile_exclude_set(PythonAnalyzer._DEFAULT_EXCLUDE_GLOBS)
@@ -31,8 +31,7 @@ def render_line_chart(
         lines.append("")
 
     # Calculate scale
-    min_val = min(values)
-    max_val = max(values)
+    min_val, max_val, _ = _min_max_sum(values)
 
     # Handle edge case where all values are the same
     if min_val == max_val:
@@ -55,35 +54,34 @@ def render_line_chart(
     else:
         x_positions = [int((i / (len(values) - 1)) * (chart_width - 1)) for i in range(len(values))]
 
-    # Map values to row indices (0 = bottom, height-1 = top)
-    def value_to_row(v: float) -> int:
-        if val_range == 0:
-            return height // 2
-        normalized = (v - min_val) / val_range
-        return int(normalized * (height - 1))
+    # Map values to row indices (0 = bottom, height-1 = top), once per value
+    if val_range == 0:
+        rows = [height // 2] * len(values)
+    else:
+        rows = [int((v - min_val) / val_range * (height - 1)) for v in values]
 
-    # Build the chart grid
-    grid: list[list[str]] = [[" " for _ in range(chart_width)] for _ in range(height)]
+    # Build the chart grid: one flat row-major list, cell (row, col) at row * chart_width + col.
+    # Every blank cell shares the same " " object, so there is no per-cell allocation.
+    grid: list[str] = [" "] * (height * chart_width)
 
     # Plot points
-    for i, v in enumerate(values):
-        row = value_to_row(v)
-        col = x_positions[i]
+    for row, col in zip(rows, x_positions, strict=True):
         if 0 <= row < height and 0 <= col < chart_width:
-            grid[row][col] = "\u25cf"  # Filled circle
+            grid[row * chart_width + col] = "\u25cf"  # Filled circle
 
     # Connect points with lines (optional - use dashes for now)
     for i in range(len(values) - 1):
-        row1 = value_to_row(values[i])
-        row2 = value_to_row(values[i + 1])
+        row1 = rows[i]
+        row2 = rows[i + 1]
         col1 = x_positions[i]
         col2 = x_positions[i + 1]
 
         # Simple horizontal connection if on same row
         if row1 == row2 and col2 - col1 > 1:
-            for c in range(col1 + 1, col2):
-                if grid[row1][c] == " ":
-                    grid[row1][c] = "-"
+            offset = row1 * chart_width
+            for c in range(offset + col1 + 1, offset + col2):
+                if grid[c] == " ":
+                    grid[c] = "-"
 
     # Render with Y-axis labels
     for row_idx in range(height - 1, -1, -1):
@@ -104,7 +102,8 @@ def render_line_chart(
         else:
             axis_char = "\u2502"  # Vertical line
 
-        lines.append(f"{label} {axis_char}{''.join(grid[row_idx])}")
+        start = row_idx * chart_width
+        lines.append(f"{label} {axis_char}{''.join(grid[start : start + chart_width])}")
 
     # X-axis
     lines.append(" " * (y_label_width + 1) + "\u2514" + "\u2500" * chart_width)
@@ -181,9 +180,8 @@ def render_trend_summary(
     lines.append(f"Last:  {last_str} {unit} ({last_label})")
 
     # Statistics
-    avg_val = float(sum(values) / len(values))
-    max_val = max(values)
-    min_val = min(values)
+    min_val, max_val, total = _min_max_sum(values)
+    avg_val = float(total / len(values))
 
     lines.append("")
     avg_str = f"{avg_val:.2f}" if not avg_val.is_integer() else f"{avg_val:.0f}"
@@ -193,6 +191,19 @@ def render_trend_summary(
     return "\n".join(lines)
 
 
+def _min_max_sum(values: list[float]) -> tuple[float, float, float]:
+    """Min, max and sum of a non-empty list in a single traversal."""
+    lo = hi = values[0]
+    total = 0
+    for v in values:
+        total += v
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi, total
+
+
 def _metric_unit(metric_name: str) -> str:
     """Get the display unit for a metric."""
     units = {
@@ -1,8 +1,8 @@
 from collections.abc import Mapping
-from pathlib import Path
 from typing import Any
 
 from pacta import PACTA_VERSION
+from pacta.cli._io import as_path, language_options
 from pacta.core.config import EngineConfig
 from pacta.core.engine import DefaultPactaEngine
 from pacta.reporting.builder import DefaultReportBuilder
@@ -24,6 +24,8 @@ def run_engine_scan(
     baseline_ref: str | None,
     mode: str,
     save_ref: str | None,
+    cache: bool = True,
+    jobs: int | None = None,
     tool_version: str | None,
 ) -> Report:
     """
@@ -48,12 +50,14 @@ def run_engine_scan(
 
     # Build EngineConfig for the new scan() signature
     cfg = EngineConfig(
-        repo_root=Path(repo_root),
-        model_file=Path(model_file) if model_file else None,
-        rules_files=tuple(Path(f) for f in rules_files),
+        repo_root=as_path(repo_root),
+        model_file=as_path(model_file) if model_file else None,
+        rules_files=tuple(as_path(f) for f in rules_files),
         baseline=baseline_ref,
         changed_only=(mode == "changed_only"),
         save_ref=save_ref,
+        parse_cache=cache,
+        language_options=language_options(jobs),
     )
 
     # Try new scan(cfg) signature first
@@ -1,20 +1,36 @@
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+
+@lru_cache(maxsize=256)
+def as_path(path: str) -> Path:
+    """
+    Path for a CLI path string, built once per distinct string.
+
+    The CLI passes paths around as strings (they end up in reports as-is);
+    Path objects are immutable, so the converted form can be shared.
+    """
+    return Path(path)
 
 
 def ensure_repo_root(path: str) -> str:
-    p = Path(path).resolve()
+    p = as_path(path).resolve()
     if not p.exists():
         raise FileNotFoundError(f"Path does not exist: {p}")
     return str(p)
 
 
 def default_rules_files(repo_root: str) -> tuple[str, ...]:
-    p = Path(repo_root)
-    candidate = p / "pacta.rules"
+    candidate = as_path(repo_root) / "pacta.rules"
     return (str(candidate),) if candidate.exists() else ()
 
 
 def default_model_file(repo_root: str) -> str | None:
-    p = Path(repo_root)
-    candidate = p / "architecture.yaml"
+    candidate = as_path(repo_root) / "architecture.yaml"
     return str(candidate) if candidate.exists() else None
+
+
+def language_options(jobs: int | None) -> dict[str, Any]:
+    """Analyzer language_options for the --jobs flag (None keeps the analyzer default)."""
+    return {"python": {"jobs": jobs}} if jobs is not None else {}
@@ -0,0 +1,86 @@
+import json
+from collections.abc import Callable
+from typing import Any, TextIO
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# The stdlib encoder leaves non-ASCII unescaped too, so both write the same text
+_STDLIB_OPTIONS: dict[str, Any] = {"default": str, "ensure_ascii": False}
+
+if _orjson is not None:
+    # Datetimes and dataclasses go through `default=str`, as with the stdlib encoder
+    _ORJSON_OPTIONS = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME | _orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize `obj` to a JSON string (no trailing newline); see json_writer()."""
+    if _orjson is None:
+        return json.dumps(obj, indent=2 if indent else None, **_STDLIB_OPTIONS)
+    option = _ORJSON_OPTIONS | _orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+    return _orjson.dumps(obj, default=str, option=option).decode()
+
+
+def utf8_writer(stream: TextIO) -> Callable[[str | bytes], None]:
+    """
+    Function writing text (or already-encoded bytes) to `stream` as UTF-8.
+
+    JSON output holds unescaped non-ASCII, which a stream with a legacy
+    encoding (e.g. cp1252 stdout on Windows) can't represent, so the UTF-8
+    bytes go straight to the stream's binary buffer. Streams without one
+    (io.StringIO, captured output) get text.
+    """
+    raw = getattr(stream, "buffer", None)
+    if raw is None:
+
+        def write_text(data: str | bytes) -> None:
+            stream.write(data.decode() if isinstance(data, bytes) else data)
+
+        return write_text
+
+    # Push out pending text once, so the byte writes land after it
+    stream.flush()
+
+    def write_bytes(data: str | bytes) -> None:
+        raw.write(data.encode() if isinstance(data, str) else data)
+
+    return write_bytes
+
+
+def json_writer(stream: TextIO, *, indent: bool = False) -> Callable[[Any], None]:
+    """
+    Function writing one JSON document, followed by a newline, per call.
+
+    Uses orjson when it is installed (`pip install pacta[speedups]`); the
+    stdlib encoder is the fallback. Either way the document is written as
+    UTF-8 (see utf8_writer()). Both leave non-ASCII unescaped and indent
+    alike, but the text can still differ: orjson's compact form has no
+    spaces after separators, it writes exponents as `1e16` where the stdlib
+    writes `1e+16`, and it turns NaN/Infinity into `null`.
+    """
+    write = utf8_writer(stream)
+
+    if _orjson is None:
+        json_indent = 2 if indent else None
+
+        def write_stdlib(obj: Any) -> None:
+            write(json.dumps(obj, indent=json_indent, **_STDLIB_OPTIONS) + "\n")
+
+        return write_stdlib
+
+    orjson_dumps = _orjson.dumps
+    option = _ORJSON_OPTIONS | _orjson.OPT_APPEND_NEWLINE
+    if indent:
+        option |= _orjson.OPT_INDENT_2
+
+    def write_orjson(obj: Any) -> None:
+        write(orjson_dumps(obj, default=str, option=option))
+
+    return write_orjson
+
+
+def write_json(obj: Any, stream: TextIO, *, indent: bool = False) -> None:
+    """Write a single JSON document, followed by a newline, to `stream`."""
+    json_writer(stream, indent=indent)(obj)
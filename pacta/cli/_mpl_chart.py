@@ -1,5 +1,39 @@
+import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+# Vector formats only stay cheap for short series: beyond this many points the
+# data artists are rasterized (axes and text stay vector)
+_VECTOR_MAX_POINTS = 500
+_VECTOR_SUFFIXES = frozenset({".svg", ".svgz", ".pdf", ".eps", ".ps"})
+
+# (matplotlib.dates, FigureCanvasAgg, Figure), imported on first use by _get_mpl()
+_MPL: tuple[Any, Any, Any] | None = None
+
+
+def _get_mpl() -> tuple[Any, Any, Any]:
+    """
+    Import the matplotlib pieces the chart needs, once per process.
+
+    matplotlib stays optional (the viz extra): nothing is imported until a
+    chart is rendered.
+
+    Raises:
+        ImportError: If matplotlib is not installed
+    """
+    global _MPL
+    if _MPL is None:
+        try:
+            import matplotlib.dates as mdates
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+        except ImportError as e:
+            raise ImportError(
+                "matplotlib is required for image export. Install it with: pip install pacta[viz]"
+            ) from e
+        _MPL = (mdates, FigureCanvasAgg, Figure)
+    return _MPL
 
 
 def render_trends_chart(
@@ -23,11 +57,7 @@ def render_trends_chart(
     Raises:
         ImportError: If matplotlib is not installed
     """
-    try:
-        import matplotlib.dates as mdates
-        import matplotlib.pyplot as plt
-    except ImportError as e:
-        raise ImportError("matplotlib is required for image export. Install it with: pip install pacta[viz]") from e
+    mdates, FigureCanvasAgg, Figure = _get_mpl()
 
     # Parse dates from labels if possible
     dates = []
@@ -42,18 +72,34 @@ def render_trends_chart(
             dates = None
             break
 
-    # Create figure
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # Create figure (a standalone Figure, not registered with pyplot's global
+    # figure manager, so nothing outlives this call). Constrained layout is
+    # resolved at draw time and is cheaper than a separate tight_layout pass.
+    fig = Figure(figsize=(10, 6), layout="constrained")
+    # Bind the Agg canvas directly: no backend resolution or GUI probing, and
+    # without matplotlib.use(), which would change the backend process-wide
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+
+    # Plot data. For long histories in SVG/PDF the data artists (line + markers,
+    # fill) are rasterized rather than written as thousands of vector paths.
+    output = Path(output_path)
+    rasterize = len(values) > _VECTOR_MAX_POINTS and output.suffix.lower() in _VECTOR_SUFFIXES
+    if rasterize:
+        print(
+            f"pacta: note: {len(values)} points; the data layer of {output.name} is rasterized. "
+            "Use a .png output for a fully raster chart.",
+            file=sys.stderr,
+        )
 
-    # Plot data
     if dates:
-        ax.plot(dates, values, marker="o", linewidth=2, markersize=8, color="#2563eb")
+        ax.plot(dates, values, marker="o", linewidth=2, markersize=8, color="#2563eb", rasterized=rasterize)
         ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %d"))
         ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-        plt.xticks(rotation=45)
+        ax.tick_params(axis="x", labelrotation=45)
     else:
         x_positions = list(range(len(values)))
-        ax.plot(x_positions, values, marker="o", linewidth=2, markersize=8, color="#2563eb")
+        ax.plot(x_positions, values, marker="o", linewidth=2, markersize=8, color="#2563eb", rasterized=rasterize)
         ax.set_xticks(x_positions)
         ax.set_xticklabels(labels, rotation=45, ha="right")
 
@@ -80,9 +126,9 @@ def render_trends_chart(
 
     # Fill area under curve
     if dates:
-        ax.fill_between(dates, values, alpha=0.1, color="#2563eb")
+        ax.fill_between(dates, values, alpha=0.1, color="#2563eb", rasterized=rasterize)
     else:
-        ax.fill_between(x_positions, values, alpha=0.1, color="#2563eb")
+        ax.fill_between(x_positions, values, alpha=0.1, color="#2563eb", rasterized=rasterize)
 
     # Add trend annotation
     if len(values) >= 2:
@@ -107,13 +153,8 @@ def render_trends_chart(
             fontweight="bold",
         )
 
-    # Tight layout
-    plt.tight_layout()
-
     # Save
-    output = Path(output_path)
     fig.savefig(output, dpi=150, bbox_inches="tight")
-    plt.close(fig)
 
 
 def is_matplotlib_available() -> bool:
@@ -1,9 +1,14 @@
+import os
 from dataclasses import replace
 from datetime import datetime
+from functools import lru_cache
 
 from pacta.reporting.types import Report, TrendPoint, TrendSummary
 from pacta.snapshot.store import FsSnapshotStore
 
+# Set (to anything but "" or "0") to leave trends out of reports entirely
+SKIP_TRENDS_ENV = "PACTA_SKIP_TRENDS"
+
 
 def attach_trends(
     report: Report,
@@ -12,13 +17,23 @@ def attach_trends(
     last: int = 5,
 ) -> Report:
     """
-    Load recent snapshots and attach a TrendSummary to the report.
+    Attach a TrendSummary of recent snapshots to the report.
+
+    Only per-snapshot counts are needed, so they come from the store's stats
+    index rather than from loading each snapshot.
 
-    Returns the report unchanged if no history is available.
+    Returns the report unchanged if no history is available, or if trends
+    are disabled via the PACTA_SKIP_TRENDS environment variable.
     """
+    if os.environ.get(SKIP_TRENDS_ENV, "") not in ("", "0"):
+        return report
+
     try:
         store = FsSnapshotStore(repo_root=repo_root)
-        objects = store.list_objects()
+        # A trend needs two points; probing the directory is cheaper than the index
+        if not store.has_objects(2):
+            return report
+        objects = store.list_object_stats()
     except Exception:
         return report
 
@@ -31,14 +46,13 @@ def attach_trends(
     entries = list(reversed(entries))
 
     points: list[TrendPoint] = []
-    for _, snapshot in entries:
-        meta = snapshot.meta
-        node_count = float(len(snapshot.nodes))
-        edge_count = float(len(snapshot.edges))
-        violation_count = float(len(snapshot.violations))
+    for stats in entries:
+        node_count = float(stats.node_count)
+        edge_count = float(stats.edge_count)
+        violation_count = float(stats.violation_count)
         density = round(edge_count / node_count, 2) if node_count > 0 else 0.0
 
-        label = _format_label(meta.created_at)
+        label = _format_label(stats.created_at)
         points.append(
             TrendPoint(
                 label=label,
@@ -63,6 +77,7 @@ def attach_trends(
     return replace(report, trends=trends)
 
 
+@lru_cache(maxsize=4096)
 def _format_label(created_at: str | None) -> str:
     if not created_at or "T" not in created_at:
         return created_at or "unknown"
@@ -1,8 +1,8 @@
 from pathlib import Path
 
-from pacta.cli._io import default_model_file, default_rules_files, ensure_repo_root
+from pacta.cli._io import as_path, default_model_file, default_rules_files, ensure_repo_root
 from pacta.cli._trends import attach_trends
-from pacta.cli.exitcodes import exit_code_from_report_dict
+from pacta.cli.exitcodes import exit_code_from_report
 from pacta.core.config import EngineConfig
 from pacta.core.engine import DefaultPactaEngine
 from pacta.reporting.renderers.github import GitHubReportRenderer
@@ -48,7 +48,7 @@ def run(
 
     # Build config
     cfg = EngineConfig(
-        repo_root=Path(repo_root),
+        repo_root=as_path(repo_root),
         model_file=Path(model_file) if model_file else None,
         rules_files=tuple(Path(f) for f in rules_files),
         baseline=baseline,
@@ -81,4 +81,4 @@ def run(
         out = TextReportRenderer(verbosity=verbosity).render(result.report)  # type: ignore[arg-type]
     print(out, end="")
 
-    return exit_code_from_report_dict(result.report.to_dict())
+    return exit_code_from_report(result.report)
@@ -12,25 +12,21 @@ def snapshot_diff(*, path: str, from_ref: str, to_ref: str) -> int:
 
     d = DefaultSnapshotDiffEngine().diff(before, after, include_details=True)
 
-    print("Snapshot diff:")
-    print(f"  nodes: +{d.nodes_added}  -{d.nodes_removed}")
-    print(f"  edges: +{d.edges_added}  -{d.edges_removed}")
+    # Assembled first and written in one call, so the block stays together in CI logs
+    lines = [
+        "Snapshot diff:",
+        f"  nodes: +{d.nodes_added}  -{d.nodes_removed}",
+        f"  edges: +{d.edges_added}  -{d.edges_removed}",
+    ]
 
     # Optional details counts
     if d.details:
-        nodes = d.details.get("nodes", {})
-        edges = d.details.get("edges", {})
-        if nodes.get("added"):
-            print(f"  nodes added: {len(nodes['added'])}")
-        if nodes.get("removed"):
-            print(f"  nodes removed: {len(nodes['removed'])}")
-        if nodes.get("changed"):
-            print(f"  nodes changed: {len(nodes['changed'])}")
-        if edges.get("added"):
-            print(f"  edges added: {len(edges['added'])}")
-        if edges.get("removed"):
-            print(f"  edges removed: {len(edges['removed'])}")
-        if edges.get("changed"):
-            print(f"  edges changed: {len(edges['changed'])}")
+        for kind in ("nodes", "edges"):
+            changes = d.details.get(kind, {})
+            for change in ("added", "removed", "changed"):
+                if changes.get(change):
+                    lines.append(f"  {kind} {change}: {len(changes[change])}")
+
+    print("\n".join(lines))
 
     return 0
@@ -1,11 +1,20 @@
 from collections.abc import Mapping
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Only for annotations: pacta.reporting is heavy, and cli.main needs the
+    # exit code constants before any command runs
+    from pacta.reporting.types import Report
 
 # CI-friendly semantics
 EXIT_OK = 0
 EXIT_NEW_VIOLATIONS = 1
 EXIT_ENGINE_ERROR = 2
 
+# Statuses of ERROR violations that fail the run. A tuple rather than a set:
+# dict-shaped reports come from JSON, where a status need not be hashable.
+_BLOCKING_STATUSES = ("new", "unknown")
+
 
 def _safe_get(mapping: Mapping[str, Any], *keys: str, default: Any = None) -> Any:
     cur: Any = mapping
@@ -16,6 +25,25 @@ def _safe_get(mapping: Mapping[str, Any], *keys: str, default: Any = None) -> An
     return cur
 
 
+def exit_code_from_report(report: "Report") -> int:
+    """
+    Determine exit code from a Report (same policy as exit_code_from_report_dict).
+
+    Reads the typed fields directly, so callers holding a Report don't have to
+    serialize the whole thing with to_dict() just to pick an exit code.
+    """
+    from pacta.reporting.types import Severity
+
+    if report.summary.engine_errors > 0:
+        return EXIT_ENGINE_ERROR
+
+    for v in report.violations:
+        if v.status in _BLOCKING_STATUSES and v.rule.severity == Severity.ERROR:
+            return EXIT_NEW_VIOLATIONS
+
+    return EXIT_OK
+
+
 def exit_code_from_report_dict(report: Mapping[str, Any]) -> int:
     """
     Determine exit code from a dict-shaped report (Report.to_dict()).
@@ -34,7 +62,7 @@ def exit_code_from_report_dict(report: Mapping[str, Any]) -> int:
             rule = v.get("rule", {}) if isinstance(v, dict) else {}
             severity = rule.get("severity", "error")
             status = v.get("status", "unknown")
-            if severity == "error" and status in ("new", "unknown"):
+            if severity == "error" and status in _BLOCKING_STATUSES:
                 return EXIT_NEW_VIOLATIONS
         except Exception:
             continue
@@ -1,13 +1,22 @@
-import json
 import sys
+from collections import Counter
+from collections.abc import Iterator
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
+from typing import Any, TextIO
 
 from pacta.cli._ascii_chart import render_line_chart, render_trend_summary
 from pacta.cli._io import ensure_repo_root
+from pacta.cli._json import dumps, json_writer, utf8_writer, write_json
 from pacta.cli.exitcodes import EXIT_OK
 from pacta.snapshot import Snapshot
-from pacta.snapshot.store import FsSnapshotStore
+from pacta.snapshot.store import FsSnapshotStore, ObjectStats
+
+# `history show --format json` output when there are no snapshots
+_EMPTY_HISTORY_JSON = '{"entries": [], "count": 0}'
+
+# Write buffer for `history export --output` (jsonl emits one small chunk per entry)
+_EXPORT_BUFFER_SIZE = 1 << 20
 
 
 def show(
@@ -28,58 +37,28 @@ def show(
         branch: Filter by branch name
         format: Output format (text or json)
     """
-    repo_root = Path(ensure_repo_root(path))
-    store = FsSnapshotStore(repo_root=str(repo_root))
+    repo_root = ensure_repo_root(path)
+    store = FsSnapshotStore(repo_root=repo_root)
 
-    # Get all objects sorted by timestamp
-    objects = store.list_objects()
+    # Filter on indexed metadata; snapshots are only loaded for --format json
+    objects = store.list_object_stats()
 
     if not objects:
         if format == "json":
-            print(json.dumps({"entries": [], "count": 0}))
+            print(_EMPTY_HISTORY_JSON)
         else:
             print("No history entries found.")
             print("Run 'pacta scan' to create snapshots.")
         return EXIT_OK
 
     # Apply filters
-    entries = []
-    for short_hash, snapshot in objects:
-        meta = snapshot.meta
-
-        # Filter by branch if specified
-        if branch and meta.branch != branch:
-            continue
-
-        # Filter by since date if specified
-        if since and meta.created_at:
-            try:
-                since_dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
-                created_dt = datetime.fromisoformat(meta.created_at.replace("Z", "+00:00"))
-                # Normalize to compare: strip timezone info for comparison
-                since_naive = since_dt.replace(tzinfo=None) if since_dt.tzinfo else since_dt
-                created_naive = created_dt.replace(tzinfo=None) if created_dt.tzinfo else created_dt
-                if created_naive < since_naive:
-                    continue
-            except ValueError:
-                pass  # Invalid date format, skip filter
-
-        entries.append((short_hash, snapshot))
-
-    # Apply limit
-    if last and last > 0:
-        entries = entries[:last]
+    entries = _filter_entries(objects, branch=branch, since=since, last=last)
 
     # Get refs for display
-    refs = store.list_refs()
-    hash_to_refs: dict[str, list[str]] = {}
-    for ref_name, ref_hash in refs.items():
-        if ref_hash not in hash_to_refs:
-            hash_to_refs[ref_hash] = []
-        hash_to_refs[ref_hash].append(ref_name)
+    hash_to_refs = store.refs_by_hash()
 
     if format == "json":
-        _output_json(entries, hash_to_refs)
+        _output_json(store, entries, hash_to_refs)
     else:
         _output_text(entries, hash_to_refs)
 
@@ -87,86 +66,118 @@ def show(
 
 
 def _output_text(
-    entries: list[tuple[str, "Snapshot"]],  # noqa: F821
+    entries: list[ObjectStats],
     hash_to_refs: dict[str, list[str]],
 ) -> None:
     """Output history in text format."""
-    print(f"Architecture Timeline ({len(entries)} entries)")
-    print("=" * 60)
-    print()
+    # Rows are collected and written with one print rather than one per entry
+    lines = [f"Architecture Timeline ({len(entries)} entries)", "=" * 60, ""]
 
-    for short_hash, snapshot in entries:
-        meta = snapshot.meta
+    for stats in entries:
+        short_hash = stats.short_hash
         refs_list = hash_to_refs.get(short_hash, [])
 
         # Format timestamp
-        timestamp = meta.created_at or "unknown"
+        timestamp = stats.created_at or "unknown"
         if "T" in timestamp:
             timestamp = timestamp.split("T")[0]  # Just date
 
         # Format commit (short)
-        commit = (meta.commit or "-------")[:7]
+        commit = (stats.commit or "-------")[:7]
 
         # Format branch
-        branch = meta.branch or "?"
+        branch = stats.branch or "?"
 
         # Counts
-        node_count = len(snapshot.nodes)
-        edge_count = len(snapshot.edges)
-        violation_count = len(snapshot.violations)
+        node_count = stats.node_count
+        edge_count = stats.edge_count
+        violation_count = stats.violation_count
 
         # Refs
         refs_str = f" ({', '.join(refs_list)})" if refs_list else ""
 
         # Output line
-        print(
+        lines.append(
             f"{short_hash}  {timestamp}  {commit}  {branch:<12}  "
             f"{node_count:>3} nodes  {edge_count:>3} edges  "
             f"{violation_count:>2} violations{refs_str}"
         )
 
-    print()
+    lines.append("")
+    print("\n".join(lines))
 
 
 def _output_json(
-    entries: list[tuple[str, "Snapshot"]],  # noqa: F821
+    store: FsSnapshotStore,
+    entries: list[ObjectStats],
     hash_to_refs: dict[str, list[str]],
 ) -> None:
-    """Output history in JSON format."""
+    """Output history in JSON format (loads only the listed snapshots)."""
     result = {
         "entries": [],
         "count": len(entries),
     }
 
-    for short_hash, snapshot in entries:
-        meta = snapshot.meta
+    for stats in entries:
+        short_hash = stats.short_hash
         refs_list = hash_to_refs.get(short_hash, [])
 
-        # Count violations by severity
-        violations_by_severity: dict[str, int] = {}
-        for v in snapshot.violations:
-            if hasattr(v, "rule") and hasattr(v.rule, "severity"):
-                sev = str(v.rule.severity.value) if hasattr(v.rule.severity, "value") else str(v.rule.severity)
-            elif isinstance(v, dict) and "rule" in v and "severity" in v["rule"]:
-                sev = v["rule"]["severity"]
-            else:
-                sev = "unknown"
-            violations_by_severity[sev] = violations_by_severity.get(sev, 0) + 1
+        # Count violations by severity (the one thing the index doesn't hold)
+        snapshot = store.load_object(short_hash)
+        violations_by_severity = _count_severities(snapshot.violations)
 
         entry = {
             "hash": short_hash,
-            "timestamp": meta.created_at,
-            "commit": meta.commit,
-            "branch": meta.branch,
+            "timestamp": stats.created_at,
+            "commit": stats.commit,
+            "branch": stats.branch,
             "refs": refs_list,
-            "node_count": len(snapshot.nodes),
-            "edge_count": len(snapshot.edges),
-            "violation_count": len(snapshot.violations),
+            "node_count": stats.node_count,
+            "edge_count": stats.edge_count,
+            "violation_count": stats.violation_count,
             "violations_by_severity": violations_by_severity,
         }
         result["entries"].append(entry)  # type: ignore[possibly-missing-attribute]
 
-    print(json.dumps(result, indent=2, default=str))
+    write_json(result, sys.stdout, indent=True)
+
+
+def _count_severities(violations: tuple[Any, ...]) -> dict[Any, int]:
+    """
+    Violation count per severity, in first-seen order.
+
+    Stored violations nearly always all share the parsed `Violation` layout,
+    so severities are tallied straight off `v.rule.severity` and only the few
+    distinct values are turned into labels. Any other entry, such as a
+    violation kept as a raw dict, sends the whole tally through _severity_of.
+    """
+    try:
+        raw = Counter([v.rule.severity for v in violations])
+    except (AttributeError, TypeError):
+        return dict(Counter(map(_severity_of, violations)))
+
+    counts: dict[Any, int] = {}
+    for severity, n in raw.items():
+        label = str(getattr(severity, "value", severity))
+        counts[label] = counts.get(label, 0) + n
+    return counts
+
+
+def _severity_of(violation: Any) -> Any:
+    """
+    Severity of a stored violation.
+
+    Violations are usually parsed `Violation` objects, but ones that failed to
+    parse are kept as plain dicts.
+    """
+    try:
+        severity = violation.rule.severity
+    except AttributeError:
+        try:
+            return violation["rule"]["severity"]
+        except (KeyError, TypeError):
+            return "unknown"
+    return str(getattr(severity, "value", severity))
 
 
 def export(
@@ -183,64 +194,110 @@ def export(
         format: Export format (json or jsonl)
         output: Output file path (default: stdout)
     """
-    repo_root = Path(ensure_repo_root(path))
-    store = FsSnapshotStore(repo_root=str(repo_root))
+    repo_root = ensure_repo_root(path)
+    store = FsSnapshotStore(repo_root=repo_root)
 
     objects = store.list_objects()
     refs = store.list_refs()
+    hash_to_refs = store.refs_by_hash()
 
-    # Build hash to refs mapping
-    hash_to_refs: dict[str, list[str]] = {}
-    for ref_name, ref_hash in refs.items():
-        if ref_hash not in hash_to_refs:
-            hash_to_refs[ref_hash] = []
-        hash_to_refs[ref_hash].append(ref_name)
-
-    # Build export data
-    entries = []
-    for short_hash, snapshot in objects:
-        meta = snapshot.meta
-
-        entry = {
-            "hash": short_hash,
-            "timestamp": meta.created_at,
-            "commit": meta.commit,
-            "branch": meta.branch,
-            "refs": hash_to_refs.get(short_hash, []),
-            "repo_root": meta.repo_root,
-            "tool_version": meta.tool_version,
-            "node_count": len(snapshot.nodes),
-            "edge_count": len(snapshot.edges),
-            "violations": [v.to_dict() if hasattr(v, "to_dict") else v for v in snapshot.violations],
-        }
-        entries.append(entry)
-
-    # Output
-    out_stream = open(output, "w") if output else sys.stdout
+    # Output (streamed: the serialized document is never held as one string)
+    # UTF-8 regardless of locale: orjson writes UTF-8 bytes straight to the buffer
+    out_stream = open(output, "w", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE) if output else sys.stdout
 
     try:
         if format == "jsonl":
-            for entry in entries:
-                out_stream.write(json.dumps(entry, default=str) + "\n")
+            # One entry built, written and dropped at a time
+            write = json_writer(out_stream)
+            for entry in _iter_export_entries(objects, hash_to_refs):
+                write(entry)
         else:
-            result = {
+            header = {
                 "version": 1,
                 "exported_at": datetime.now().isoformat(),
-                "repo_root": str(repo_root),
+                "repo_root": repo_root,
                 "refs": refs,
-                "entries": entries,
             }
-            out_stream.write(json.dumps(result, indent=2, default=str) + "\n")
+            _write_export_document(out_stream, header, _iter_export_entries(objects, hash_to_refs))
     finally:
         if output:
             out_stream.close()
 
     if output:
-        print(f"Exported {len(entries)} entries to {output}", file=sys.stderr)
+        print(f"Exported {len(objects)} entries to {output}", file=sys.stderr)
 
     return EXIT_OK
 
 
+def _write_export_document(out_stream: TextIO, header: dict[str, Any], entries: Iterator[dict[str, Any]]) -> None:
+    """
+    Write `header` plus an "entries" list as one indented JSON document.
+
+    The text is the same as dumping `{**header, "entries": list(entries)}`
+    with indent=2, but entries are serialized and written one at a time.
+    """
+    write = utf8_writer(out_stream)
+
+    # Header object without its closing "\n}"; JSON strings never hold a raw newline
+    write(dumps(header, indent=True)[:-2])
+    write(',\n  "entries": [')
+
+    separator = "\n    "
+    for entry in entries:
+        write(separator)
+        write(dumps(entry, indent=True).replace("\n", "\n    "))
+        separator = ",\n    "
+
+    # An empty list stays on one line, as json.dump writes it
+    write("]\n}\n" if separator == "\n    " else "\n  ]\n}\n")
+
+
+def _iter_export_entries(
+    objects: list[tuple[str, "Snapshot"]],
+    hash_to_refs: dict[str, list[str]],
+) -> Iterator[dict[str, Any]]:
+    """Build export entries lazily, one per snapshot."""
+    for short_hash, snapshot in objects:
+        yield _export_entry(short_hash, snapshot, hash_to_refs)
+
+
+def _export_entry(short_hash: str, snapshot: "Snapshot", hash_to_refs: dict[str, list[str]]) -> dict[str, Any]:
+    """
+    Export entry for one snapshot.
+
+    Entries are independent of each other. They are still built serially:
+    the conversion is pure-Python object walking, which holds the GIL, so a
+    thread pool only adds scheduling overhead.
+    """
+    meta = snapshot.meta
+
+    return {
+        "hash": short_hash,
+        "timestamp": meta.created_at,
+        "commit": meta.commit,
+        "branch": meta.branch,
+        "refs": hash_to_refs.get(short_hash, []),
+        "repo_root": meta.repo_root,
+        "tool_version": meta.tool_version,
+        "node_count": len(snapshot.nodes),
+        "edge_count": len(snapshot.edges),
+        "violations": _violation_dicts(snapshot.violations),
+    }
+
+
+def _violation_dicts(violations: tuple[Any, ...]) -> list[Any]:
+    """
+    Violations in dict form: parsed ones via to_dict(), raw dicts as they are.
+
+    Normally every violation is parsed, so to_dict() is called without probing
+    each one; an entry without it reruns the conversion item by item.
+    """
+    try:
+        return [v.to_dict() for v in violations]
+    except AttributeError:
+        return [v.to_dict() if hasattr(v, "to_dict") else v for v in violations]
+
+
 def trends(
     *,
     path: str,
@@ -265,15 +322,16 @@ def trends(
         format: Output format (text or json)
         output: Output file for image export (PNG/SVG)
     """
-    repo_root = Path(ensure_repo_root(path))
-    store = FsSnapshotStore(repo_root=str(repo_root))
+    repo_root = ensure_repo_root(path)
+    store = FsSnapshotStore(repo_root=repo_root)
 
-    # Get all objects sorted by timestamp
-    objects = store.list_objects()
+    # Trends only need per-snapshot counts: use the stats index instead of
+    # loading every snapshot (sorted by timestamp, newest first)
+    objects = store.list_object_stats()
 
     if not objects:
         if format == "json":
-            print(json.dumps({"metric": metric, "data_points": [], "count": 0}))
+            write_json({"metric": metric, "data_points": [], "count": 0}, sys.stdout)
         else:
             print("No history entries found.")
             print("Run 'pacta scan' to create snapshots.")
@@ -284,7 +342,7 @@ def trends(
 
     if not entries:
         if format == "json":
-            print(json.dumps({"metric": metric, "data_points": [], "count": 0}))
+            write_json({"metric": metric, "data_points": [], "count": 0}, sys.stdout)
         else:
             print("No matching entries found after applying filters.")
         return EXIT_OK
@@ -292,28 +350,12 @@ def trends(
     # Reverse to chronological order (oldest first) for trend display
     entries = list(reversed(entries))
 
-    # Extract metric values
-    values: list[float] = []
+    # Extract metric values (one column at a time)
+    values = _metric_values(entries, metric)
     labels: list[str] = []
 
-    for _, snapshot in entries:
-        meta = snapshot.meta
-        value = _extract_metric(snapshot, metric)
-        values.append(value)
-
-        # Format label (short date)
-        timestamp = meta.created_at or "unknown"
-        if "T" in timestamp:
-            label = timestamp.split("T")[0]  # Just date (YYYY-MM-DD)
-            # Shorten to MMM DD format
-            try:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                label = dt.strftime("%b %d")
-            except ValueError:
-                pass
-        else:
-            label = timestamp[:10]
-        labels.append(label)
+    for stats in entries:
+        labels.append(_trend_label(stats.created_at or "unknown"))
 
     # Handle output
     if output:
@@ -329,61 +371,97 @@ def trends(
 
 
 def _filter_entries(
-    objects: list[tuple[str, "Snapshot"]],
+    objects: list[ObjectStats],
     *,
     branch: str | None = None,
     since: str | None = None,
     last: int | None = None,
-) -> list[tuple[str, "Snapshot"]]:
-    """Filter entries by branch, date, and limit."""
-    entries = []
+) -> list[ObjectStats]:
+    """Filter entries by branch, date, and limit (shared by show and trends)."""
+    # Parse the cutoff once; an invalid --since disables the date filter
+    since_naive = _parse_naive(since) if since else None
+    # Objects come newest first, so the scan can stop once the limit is reached
+    limit = last if last and last > 0 else None
 
-    for short_hash, snapshot in objects:
-        meta = snapshot.meta
+    # Nothing to test per entry: just the newest `limit` objects
+    if not branch and since_naive is None:
+        return objects[:limit]
 
+    entries = []
+
+    for entry in objects:
         # Filter by branch if specified
-        if branch and meta.branch != branch:
+        if branch and entry.branch != branch:
             continue
 
         # Filter by since date if specified
-        if since and meta.created_at:
-            try:
-                since_dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
-                created_dt = datetime.fromisoformat(meta.created_at.replace("Z", "+00:00"))
-                # Normalize to compare: strip timezone info for comparison
-                since_naive = since_dt.replace(tzinfo=None) if since_dt.tzinfo else since_dt
-                created_naive = created_dt.replace(tzinfo=None) if created_dt.tzinfo else created_dt
-                if created_naive < since_naive:
-                    continue
-            except ValueError:
-                pass  # Invalid date format, skip filter
-
-        entries.append((short_hash, snapshot))
-
-    # Apply limit
-    if last and last > 0:
-        entries = entries[:last]
+        if since_naive is not None and entry.created_at:
+            created_naive = _parse_naive(entry.created_at)
+            if created_naive is not None and created_naive < since_naive:
+                continue
+
+        entries.append(entry)
+        if len(entries) == limit:
+            break
 
     return entries
 
 
-def _extract_metric(snapshot: "Snapshot", metric: str) -> float:
-    """Extract a metric value from a snapshot."""
+@lru_cache(maxsize=4096)
+def _trend_label(timestamp: str) -> str:
+    """Short chart label (MMM DD) for a snapshot timestamp; memoized per string."""
+    if "T" in timestamp:
+        label = timestamp.split("T")[0]  # Just date (YYYY-MM-DD)
+        # Shorten to MMM DD format
+        try:
+            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            label = dt.strftime("%b %d")
+        except ValueError:
+            pass
+    else:
+        label = timestamp[:10]
+    return label
+
+
+@lru_cache(maxsize=4096)
+def _parse_naive(timestamp: str) -> datetime | None:
+    """
+    Parse an ISO-8601 timestamp, dropping any timezone for comparison.
+
+    Returns None for an invalid timestamp. Memoized: the same snapshot
+    timestamps are compared on every filtered command.
+    """
+    # Cut a trailing "Z" or "+HH:MM" off the text and parse the wall-clock part;
+    # that is several times cheaper than an aware parse plus replace(tzinfo=None)
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1]
+    elif _is_utc_offset(timestamp[-6:]):
+        timestamp = timestamp[:-6]
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def _is_utc_offset(text: str) -> bool:
+    """Whether `text` is a "+HH:MM" / "-HH:MM" UTC offset."""
+    return len(text) == 6 and text[0] in "+-" and text[3] == ":" and text[1:3].isdigit() and text[4:].isdigit()
+
+
+def _metric_values(entries: list[ObjectStats], metric: str) -> list[float]:
+    """Extract a metric for all entries, dispatching on the metric once."""
     if metric == "violations":
-        return float(len(snapshot.violations))
+        return [float(s.violation_count) for s in entries]
     elif metric == "nodes":
-        return float(len(snapshot.nodes))
+        return [float(s.node_count) for s in entries]
     elif metric == "edges":
-        return float(len(snapshot.edges))
+        return [float(s.edge_count) for s in entries]
     elif metric == "density":
         # Density = edges / nodes (coupling ratio)
-        node_count = len(snapshot.nodes)
-        edge_count = len(snapshot.edges)
-        if node_count == 0:
-            return 0.0
-        return round(edge_count / node_count, 2)
+        return [round(s.edge_count / s.node_count, 2) if s.node_count else 0.0 for s in entries]
     else:
-        return 0.0
+        return [0.0] * len(entries)
 
 
 def _output_trends_text(
@@ -415,20 +493,20 @@ def _output_trends_json(
     metric: str,
     values: list[float],
     labels: list[str],
-    entries: list[tuple[str, "Snapshot"]],
+    entries: list[ObjectStats],
 ) -> None:
     """Output trends in JSON format."""
-    data_points = []
-
-    for i, (short_hash, snapshot) in enumerate(entries):
-        data_points.append(
-            {
-                "hash": short_hash,
-                "timestamp": snapshot.meta.created_at,
-                "label": labels[i],
-                "value": values[i],
-            }
-        )
+    # A dict display per point compiles to a single constant-keys map build;
+    # the key strings are shared constants, not per-point copies
+    data_points = [
+        {
+            "hash": stats.short_hash,
+            "timestamp": stats.created_at,
+            "label": label,
+            "value": value,
+        }
+        for stats, label, value in zip(entries, labels, values, strict=True)
+    ]
 
     first_val = values[0] if values else None
     last_val = values[-1] if values else None
@@ -448,7 +526,7 @@ def _output_trends_json(
         },
     }
 
-    print(json.dumps(result, indent=2, default=str))
+    write_json(result, sys.stdout, indent=True)
 
 
 def _output_trends_image(
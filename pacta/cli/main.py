@@ -1,17 +1,15 @@
 import argparse
 import sys
+from collections.abc import Callable
+from typing import TypeAlias
 
-from pacta.cli import check, diff, history, scan, snapshot
 from pacta.cli.exitcodes import EXIT_ENGINE_ERROR
 
+# What ArgumentParser.add_subparsers() returns
+_SubParsers: TypeAlias = "argparse._SubParsersAction[argparse.ArgumentParser]"
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(prog="pacta", description="Pacta — Architecture testing & architecture-as-code")
-    p.add_argument("--version", dest="tool_version", default=None, help="Override tool version for reporting.")
-
-    sub = p.add_subparsers(dest="cmd", required=True)
 
-    # scan
+def _add_scan_parser(sub: _SubParsers) -> None:
     scan_p = sub.add_parser("scan", help="Scan repository and evaluate rules.")
     scan_p.add_argument("path", nargs="?", default=".", help="Repository root (default: .)")
     scan_p.add_argument("--format", choices=["text", "json", "github"], default="text", help="Output format.")
@@ -22,11 +20,21 @@ def build_parser() -> argparse.ArgumentParser:
     scan_p.add_argument(
         "--save-ref", dest="save_ref", default=None, help="Save snapshot under this ref (e.g. baseline)."
     )
+    scan_p.add_argument(
+        "--no-cache", dest="cache", action="store_false", help="Don't use the analysis cache in .pacta/cache/."
+    )
+    scan_p.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Processes for parsing Python files (default: CPU count; 1 parses in-process).",
+    )
     verbosity = scan_p.add_mutually_exclusive_group()
     verbosity.add_argument("-q", "--quiet", action="store_true", help="Minimal output (summary only).")
     verbosity.add_argument("-v", "--verbose", action="store_true", help="Verbose output (include all details).")
 
-    # check
+
+def _add_check_parser(sub: _SubParsers) -> None:
     check_p = sub.add_parser("check", help="Evaluate rules against a snapshot.")
     check_p.add_argument("path", nargs="?", default=".", help="Repository root (default: .)")
     check_p.add_argument("--ref", default="latest", help="Snapshot ref to check (default: latest).")
@@ -39,7 +47,8 @@ def build_parser() -> argparse.ArgumentParser:
     check_verbosity.add_argument("-q", "--quiet", action="store_true", help="Minimal output (summary only).")
     check_verbosity.add_argument("-v", "--verbose", action="store_true", help="Verbose output (include all details).")
 
-    # snapshot
+
+def _add_snapshot_parser(sub: _SubParsers) -> None:
     snap = sub.add_parser("snapshot", help="Snapshot operations.")
     snap_sub = snap.add_subparsers(dest="snapshot_cmd", required=True)
 
@@ -47,14 +56,25 @@ def build_parser() -> argparse.ArgumentParser:
     snap_save.add_argument("path", nargs="?", default=".", help="Repository root (default: .)")
     snap_save.add_argument("--ref", default="latest", help="Snapshot ref (default: latest).")
     snap_save.add_argument("--model", default=None, help="Architecture model file (architecture.yaml).")
+    snap_save.add_argument(
+        "--no-cache", dest="cache", action="store_false", help="Don't use the analysis cache in .pacta/cache/."
+    )
+    snap_save.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Processes for parsing Python files (default: CPU count; 1 parses in-process).",
+    )
+
 
-    # diff
+def _add_diff_parser(sub: _SubParsers) -> None:
     diff_p = sub.add_parser("diff", help="Diff two snapshots.")
     diff_p.add_argument("path", nargs="?", default=".", help="Repository root (default: .)")
     diff_p.add_argument("--from", dest="from_ref", required=True, help="From snapshot ref.")
     diff_p.add_argument("--to", dest="to_ref", required=True, help="To snapshot ref.")
 
-    # history
+
+def _add_history_parser(sub: _SubParsers) -> None:
     hist = sub.add_parser("history", help="View architecture history.")
     hist_sub = hist.add_subparsers(dest="history_cmd", required=True)
 
@@ -87,81 +107,171 @@ def build_parser() -> argparse.ArgumentParser:
         "--output", "-o", default=None, help="Output file for image export (PNG/SVG). Requires pacta[viz]."
     )
 
+
+# Subcommand name -> function adding its parser (and nested subcommands)
+_SUBPARSERS: dict[str, Callable[[_SubParsers], None]] = {
+    "scan": _add_scan_parser,
+    "check": _add_check_parser,
+    "snapshot": _add_snapshot_parser,
+    "diff": _add_diff_parser,
+    "history": _add_history_parser,
+}
+
+
+def build_parser(cmd: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI argument parser.
+
+    With a known `cmd`, only that subcommand's parser is added, which is all
+    parsing its arguments needs; otherwise the full command tree is built.
+    """
+    p = argparse.ArgumentParser(prog="pacta", description="Pacta — Architecture testing & architecture-as-code")
+    p.add_argument("--version", dest="tool_version", default=None, help="Override tool version for reporting.")
+
+    sub = p.add_subparsers(dest="cmd", required=True)
+    adders = (_SUBPARSERS[cmd],) if cmd in _SUBPARSERS else _SUBPARSERS.values()
+    for add_parser in adders:
+        add_parser(sub)
+
     return p
 
 
+def _peek_command(argv: list[str]) -> str | None:
+    """
+    Subcommand named in `argv`: its first positional argument.
+
+    Skips the value of the root `--version` option (or an abbreviation of it).
+    Returns None if help (or "--") comes first, so the full tree is built.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help", "--"):
+            return None
+        if len(arg) > 2 and "--version".startswith(arg):
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+# Command modules pull in the engine, store, reporting, etc., so each runner
+# imports its module only when its command runs. A runner returns None for an
+# unknown nested subcommand.
+
+
+def _verbosity(args: argparse.Namespace) -> str:
+    return "quiet" if args.quiet else ("verbose" if args.verbose else "normal")
+
+
+def _run_scan(args: argparse.Namespace) -> int | None:
+    from pacta.cli import scan
+
+    return scan.run(
+        path=args.path,
+        fmt=args.format,
+        rules=tuple(args.rules) if args.rules is not None else None,
+        model=args.model,
+        baseline=args.baseline,
+        mode=args.mode,
+        save_ref=args.save_ref,
+        cache=args.cache,
+        jobs=args.jobs,
+        verbosity=_verbosity(args),
+        tool_version=args.tool_version,
+    )
+
+
+def _run_check(args: argparse.Namespace) -> int | None:
+    from pacta.cli import check
+
+    return check.run(
+        path=args.path,
+        ref=args.ref,
+        fmt=args.format,
+        rules=tuple(args.rules) if args.rules is not None else None,
+        model=args.model,
+        baseline=args.baseline,
+        save_ref=args.save_ref,
+        verbosity=_verbosity(args),
+        tool_version=args.tool_version,
+    )
+
+
+def _run_snapshot(args: argparse.Namespace) -> int | None:
+    from pacta.cli import snapshot
+
+    if args.snapshot_cmd == "save":
+        return snapshot.save(
+            path=args.path,
+            ref=args.ref,
+            model=args.model,
+            cache=args.cache,
+            jobs=args.jobs,
+            tool_version=args.tool_version,
+        )
+    return None
+
+
+def _run_diff(args: argparse.Namespace) -> int | None:
+    from pacta.cli import diff
+
+    return diff.snapshot_diff(path=args.path, from_ref=args.from_ref, to_ref=args.to_ref)
+
+
+def _run_history(args: argparse.Namespace) -> int | None:
+    from pacta.cli import history
+
+    if args.history_cmd == "show":
+        return history.show(
+            path=args.path,
+            last=args.last,
+            since=args.since,
+            branch=args.branch,
+            format=args.format,
+        )
+    if args.history_cmd == "export":
+        return history.export(
+            path=args.path,
+            format=args.format,
+            output=args.output,
+        )
+    if args.history_cmd == "trends":
+        return history.trends(
+            path=args.path,
+            metric=args.metric,
+            last=args.last,
+            since=args.since,
+            branch=args.branch,
+            width=args.width,
+            format=args.format,
+            output=args.output,
+        )
+    return None
+
+
+# Subcommand name -> function running it
+_COMMANDS: dict[str, Callable[[argparse.Namespace], int | None]] = {
+    "scan": _run_scan,
+    "check": _run_check,
+    "snapshot": _run_snapshot,
+    "diff": _run_diff,
+    "history": _run_history,
+}
+
+
 def main(argv: list[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    args, extras = build_parser(_peek_command(argv)).parse_known_args(argv)
+    if extras:
+        # Reported by the full parser, so the usage line lists every command
+        args = build_parser().parse_args(argv)
 
     try:
-        if args.cmd == "scan":
-            rules = tuple(args.rules) if args.rules is not None else None
-            verbosity = "quiet" if args.quiet else ("verbose" if args.verbose else "normal")
-            return scan.run(
-                path=args.path,
-                fmt=args.format,
-                rules=rules,
-                model=args.model,
-                baseline=args.baseline,
-                mode=args.mode,
-                save_ref=args.save_ref,
-                verbosity=verbosity,
-                tool_version=args.tool_version,
-            )
-
-        if args.cmd == "check":
-            rules = tuple(args.rules) if args.rules is not None else None
-            verbosity = "quiet" if args.quiet else ("verbose" if args.verbose else "normal")
-            return check.run(
-                path=args.path,
-                ref=args.ref,
-                fmt=args.format,
-                rules=rules,
-                model=args.model,
-                baseline=args.baseline,
-                save_ref=args.save_ref,
-                verbosity=verbosity,
-                tool_version=args.tool_version,
-            )
-
-        if args.cmd == "snapshot":
-            if args.snapshot_cmd == "save":
-                return snapshot.save(
-                    path=args.path,
-                    ref=args.ref,
-                    model=args.model,
-                    tool_version=args.tool_version,
-                )
-
-        if args.cmd == "diff":
-            return diff.snapshot_diff(path=args.path, from_ref=args.from_ref, to_ref=args.to_ref)
-
-        if args.cmd == "history":
-            if args.history_cmd == "show":
-                return history.show(
-                    path=args.path,
-                    last=args.last,
-                    since=args.since,
-                    branch=args.branch,
-                    format=args.format,
-                )
-            if args.history_cmd == "export":
-                return history.export(
-                    path=args.path,
-                    format=args.format,
-                    output=args.output,
-                )
-            if args.history_cmd == "trends":
-                return history.trends(
-                    path=args.path,
-                    metric=args.metric,
-                    last=args.last,
-                    since=args.since,
-                    branch=args.branch,
-                    width=args.width,
-                    format=args.format,
-                    output=args.output,
-                )
+        run = _COMMANDS.get(args.cmd)
+        code = run(args) if run is not None else None
+        if code is not None:
+            return code
 
         print("Unknown command.", file=sys.stderr)
         return EXIT_ENGINE_ERROR
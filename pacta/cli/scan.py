@@ -1,7 +1,7 @@
 from pacta.cli._engine_adapter import run_engine_scan
 from pacta.cli._io import default_model_file, default_rules_files, ensure_repo_root
 from pacta.cli._trends import attach_trends
-from pacta.cli.exitcodes import exit_code_from_report_dict
+from pacta.cli.exitcodes import exit_code_from_report
 from pacta.reporting.renderers.github import GitHubReportRenderer
 from pacta.reporting.renderers.json import JsonReportRenderer
 from pacta.reporting.renderers.text import TextReportRenderer
@@ -16,6 +16,8 @@ def run(
     baseline: str | None,
     mode: str,
     save_ref: str | None,
+    cache: bool = True,
+    jobs: int | None = None,
     verbosity: str = "normal",
     tool_version: str | None,
 ) -> int:
@@ -31,6 +33,8 @@ def run(
         baseline_ref=baseline,
         mode=mode,
         save_ref=save_ref,
+        cache=cache,
+        jobs=jobs,
         tool_version=tool_version,
     )
 
@@ -43,4 +47,4 @@ def run(
         out = TextReportRenderer(verbosity=verbosity).render(report)  # type: ignore[arg-type]
     print(out, end="")
 
-    return exit_code_from_report_dict(report.to_dict())
+    return exit_code_from_report(report)
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from pacta.cli._io import ensure_repo_root
+from pacta.cli._io import as_path, ensure_repo_root, language_options
 from pacta.core.config import EngineConfig
 from pacta.core.engine import DefaultPactaEngine
 from pacta.snapshot.builder import DefaultSnapshotBuilder
@@ -14,6 +14,8 @@ def save(
     path: str,
     ref: str,
     model: str | None,
+    cache: bool = True,
+    jobs: int | None = None,
     tool_version: str | None,
 ) -> int:
     """
@@ -30,22 +32,27 @@ def save(
         path: Repository root path
         ref: Snapshot reference name (default: "latest")
         model: Architecture model file path (optional, for enrichment)
+        cache: Reuse per-file analysis results from .pacta/cache/
+        jobs: Processes for parsing Python files (None: CPU count)
         tool_version: Tool version for metadata
     """
-    repo_root = Path(ensure_repo_root(path))
+    repo_root = ensure_repo_root(path)
+    root_path = as_path(repo_root)
 
     # Build engine config (no rules - just architecture analysis)
     model_file: Path | None = None
     if model:
         model_file = Path(model)
         if not model_file.is_absolute():
-            model_file = repo_root / model_file
+            model_file = root_path / model_file
 
     cfg = EngineConfig(
-        repo_root=repo_root,
+        repo_root=root_path,
         rules_files=(),  # No rules for snapshot save
         model_file=model_file,
         deterministic=True,
+        parse_cache=cache,
+        language_options=language_options(jobs),
     )
 
     # Build IR without running rules
@@ -59,14 +66,14 @@ def save(
 
     # Build and save snapshot (no violations)
     meta = SnapshotMeta(
-        repo_root=str(repo_root),
+        repo_root=repo_root,
         tool_version=tool_version,
         commit=commit,
         branch=branch,
     )
     snap = DefaultSnapshotBuilder().build(ir, meta=meta)
 
-    store = FsSnapshotStore(repo_root=str(repo_root))
+    store = FsSnapshotStore(repo_root=repo_root)
     result = store.save(snap, refs=[ref])
 
     print(f"Saved snapshot: {result.short_hash}")
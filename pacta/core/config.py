@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EngineConfig:
     repo_root: Path
     model_file: Path | None
@@ -14,3 +16,5 @@ class EngineConfig:
     output_format: str = "text"
     deterministic: bool = True
     save_ref: str | None = None  # Save snapshot under this ref (in addition to "latest")
+    parse_cache: bool = True  # Reuse per-file analysis results from .pacta/cache/
+    language_options: Mapping[str, Any] = field(default_factory=dict)  # Passed to analyzers as-is
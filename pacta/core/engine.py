@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from pathlib import Path
 
 from pacta.core.config import EngineConfig
 from pacta.ir import ArchitectureIR, DefaultIRMerger, DefaultIRNormalizer, validate_ir
@@ -9,7 +10,7 @@ from pacta.model import (
     DefaultArchitectureModelValidator,
     DefaultModelResolver,
 )
-from pacta.plugins.interfaces import AnalyzeConfig
+from pacta.plugins.interfaces import AnalyzeConfig, AnalyzeTarget
 from pacta.plugins.registry import AnalyzerRegistry
 from pacta.reporting import DefaultReportBuilder, DefaultViolationKeyFactory, EngineError, Report, RunInfo, Violation
 from pacta.rules import DefaultDSLParser, DefaultRuleEvaluator, DefaultRuleSourceLoader, RulesCompiler, RuleSet
@@ -20,24 +21,41 @@ from pacta.snapshot import (
     FsSnapshotStore,
     Snapshot,
     SnapshotDiff,
+    SnapshotMeta,
 )
 from pacta.vcs.git import GitVCSProvider
 
+# Compiled rulesets kept per engine (distinct rules-file states)
+_RULESET_CACHE_SIZE = 8
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ScanResult:
     snapshot: Snapshot
     report: Report
     diff: SnapshotDiff | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckResult:
     snapshot: Snapshot
     report: Report
     diff: SnapshotDiff | None
 
 
+def _rules_signature(rules_files: tuple[Path, ...]) -> tuple[tuple[str, int, int], ...] | None:
+    """(path, mtime_ns, size) of every rules file; None if one can't be stat'ed."""
+    entries: list[tuple[str, int, int]] = []
+    for path in rules_files:
+        try:
+            st = path.stat()
+        except OSError:
+            # Missing/unreadable file: left to the loader to report
+            return None
+        entries.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(entries)
+
+
 # Default engine wiring
 
 
@@ -68,6 +86,9 @@ class DefaultPactaEngine:
         self.rule_compiler = RulesCompiler()
         self.rule_evaluator = DefaultRuleEvaluator()
 
+        # (path, mtime_ns, size) of each rules file -> compiled RuleSet
+        self._ruleset_cache: dict[tuple[tuple[str, int, int], ...], RuleSet] = {}
+
         # Snapshot/diff/baseline
         self.snapshot_builder = DefaultSnapshotBuilder()
         # Note: snapshot_store is created per-scan with repo_root
@@ -81,9 +102,32 @@ class DefaultPactaEngine:
         # VCS (optional)
         self.vcs = GitVCSProvider()
 
+    def _compile_rules(self, rules_files: tuple[Path, ...]) -> RuleSet:
+        """
+        Load, parse and compile rules files (step 6).
+
+        A RuleSet is immutable, so it is reused while every file keeps its
+        mtime and size; an engine running repeated scans compiles only when
+        the rules change. Failures are raised and never cached.
+        """
+        key = _rules_signature(rules_files)
+        if key is not None and key in self._ruleset_cache:
+            return self._ruleset_cache[key]
+
+        sources = self.rule_source_loader.load_sources(rules_files)
+        ast_file = self.dsl_parser.parse_many(sources, source_names=[str(p) for p in rules_files])
+        ruleset = self.rule_compiler.compile(ast_file)
+
+        if key is not None:
+            if len(self._ruleset_cache) >= _RULESET_CACHE_SIZE:
+                # Oldest first (dicts keep insertion order)
+                del self._ruleset_cache[next(iter(self._ruleset_cache))]
+            self._ruleset_cache[key] = ruleset
+        return ruleset
+
     def scan(self, cfg: EngineConfig) -> ScanResult:
         engine_errors: list[EngineError] = []
-        violations: tuple[Violation] = tuple()
+        violations: tuple[Violation, ...] = ()
         diff: SnapshotDiff | None = None
 
         # Create snapshot store for this scan
@@ -114,8 +158,6 @@ class DefaultPactaEngine:
         # ----------------------------
         # 2) Analyze (produce raw IRs)
         # ----------------------------
-        from pacta.plugins.interfaces.analyzer import AnalyzeTarget
-
         analyze_cfg = AnalyzeConfig(
             repo_root=cfg.repo_root,
             target=AnalyzeTarget(
@@ -123,7 +165,8 @@ class DefaultPactaEngine:
                 exclude_globs=cfg.exclude_globs,
             ),
             deterministic=cfg.deterministic,
-            language_options={},
+            language_options=cfg.language_options,
+            cache_dir=cfg.repo_root / ".pacta" / "cache" if cfg.parse_cache else None,
         )
 
         raw_irs: list[ArchitectureIR] = []
@@ -191,9 +234,7 @@ class DefaultPactaEngine:
         # 6) Load + parse + compile rules
         # ----------------------------
         try:
-            sources = self.rule_source_loader.load_sources(cfg.rules_files)
-            ast_file = self.dsl_parser.parse_many(sources, source_names=[str(p) for p in cfg.rules_files])
-            ruleset: RuleSet = self.rule_compiler.compile(ast_file)
+            ruleset: RuleSet = self._compile_rules(cfg.rules_files)
         except Exception as e:
             engine_errors.append(
                 EngineError(
@@ -219,13 +260,11 @@ class DefaultPactaEngine:
                     details={"error": repr(e)},
                 )
             )
-            violations = tuple()
+            violations = ()
 
         # ----------------------------
         # 8) Build snapshot and load baseline snapshot (optional)
         # ----------------------------
-        from pacta.snapshot.types import SnapshotMeta
-
         # Build snapshot with violations included (for baseline comparison)
         snapshot = self.snapshot_builder.build(
             enriched_ir,
@@ -306,8 +345,6 @@ class DefaultPactaEngine:
         Raises:
             RuntimeError: If no analyzers are found or analysis fails
         """
-        from pacta.plugins.interfaces.analyzer import AnalyzeTarget
-
         # ----------------------------
         # 1) Load analyzers
         # ----------------------------
@@ -329,7 +366,8 @@ class DefaultPactaEngine:
                 exclude_globs=cfg.exclude_globs,
             ),
             deterministic=cfg.deterministic,
-            language_options={},
+            language_options=cfg.language_options,
+            cache_dir=cfg.repo_root / ".pacta" / "cache" if cfg.parse_cache else None,
         )
 
         raw_irs: list[ArchitectureIR] = []
@@ -392,7 +430,7 @@ class DefaultPactaEngine:
             CheckResult with updated snapshot (including violations) and report
         """
         engine_errors: list[EngineError] = []
-        violations: tuple[Violation, ...] = tuple()
+        violations: tuple[Violation, ...] = ()
         diff: SnapshotDiff | None = None
 
         snapshot_store = FsSnapshotStore(repo_root=str(cfg.repo_root))
@@ -442,9 +480,7 @@ class DefaultPactaEngine:
 
         # 6) Load + parse + compile rules
         try:
-            sources = self.rule_source_loader.load_sources(cfg.rules_files)
-            ast_file = self.dsl_parser.parse_many(sources, source_names=[str(p) for p in cfg.rules_files])
-            ruleset: RuleSet = self.rule_compiler.compile(ast_file)
+            ruleset: RuleSet = self._compile_rules(cfg.rules_files)
         except Exception as e:
             engine_errors.append(
                 EngineError(
@@ -468,7 +504,7 @@ class DefaultPactaEngine:
                     details={"error": repr(e)},
                 )
             )
-            violations = tuple()
+            violations = ()
 
         # 8) Build updated snapshot with violations, compare baseline
 
@@ -99,6 +99,8 @@ def dedupe_nodes(nodes: Iterable[IRNode], *, deterministic: bool = False) -> tup
     """
     Dedupe by node_key() with deterministic tie-breaking (keep first).
     Then optionally sort by key for stability.
+
+    Each key is computed once; the sort reuses the stored keys.
     """
     seen: dict[str, IRNode] = {}
     for n in nodes:
@@ -106,11 +108,11 @@ def dedupe_nodes(nodes: Iterable[IRNode], *, deterministic: bool = False) -> tup
         if k not in seen:
             seen[k] = n
 
-    out = list(seen.values())
     if deterministic:
-        out.sort(key=lambda n: node_key(n))
+        # keys are unique, so sorting the keys alone orders the values
+        return tuple(seen[k] for k in sorted(seen))
 
-    return tuple(out)
+    return tuple(seen.values())
 
 
 def dedupe_edges(
@@ -129,8 +131,7 @@ def dedupe_edges(
         if k not in seen:
             seen[k] = e
 
-    out = list(seen.values())
     if deterministic:
-        out.sort(key=lambda e: edge_key(e, include_location=include_location, include_details=include_details))
+        return tuple(seen[k] for k in sorted(seen))
 
-    return tuple(out)
+    return tuple(seen.values())
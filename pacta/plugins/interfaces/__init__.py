@@ -1,3 +1,3 @@
-from .analyzer import AnalyzeConfig, Analyzer
+from .analyzer import AnalyzeConfig, Analyzer, AnalyzeTarget
 
-__all__ = ("AnalyzeConfig", "Analyzer")
+__all__ = ("AnalyzeConfig", "Analyzer", "AnalyzeTarget")
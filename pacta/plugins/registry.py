@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from importlib.metadata import entry_points
+from functools import lru_cache
+from importlib.metadata import EntryPoint, entry_points
 from pathlib import Path
 from typing import Final
 
@@ -9,6 +10,18 @@ from pacta.plugins.interfaces import Analyzer
 ENTRYPOINT_GROUP: Final[str] = "pacta.analyzers"
 
 
+@lru_cache(maxsize=1)
+def _analyzer_entrypoints() -> tuple[EntryPoint, ...]:
+    """
+    Entrypoints in ENTRYPOINT_GROUP, discovered once per process.
+
+    Finding them walks the metadata of every installed distribution; the set
+    doesn't change while running. Call `_analyzer_entrypoints.cache_clear()`
+    after installing plugins in-process.
+    """
+    return tuple(entry_points(group=ENTRYPOINT_GROUP))
+
+
 @dataclass(frozen=True, slots=True)
 class LoadedAnalyzer:
     """
@@ -54,15 +67,13 @@ class AnalyzerRegistry:
             1) a class (callable) returning Analyzer instance
             2) a singleton Analyzer instance
         - If called multiple times, does nothing after first successful call.
+        - Discovery itself is shared by all registries in the process.
         """
         if self._entrypoints_loaded:
             return
 
-        eps = entry_points()
-        # Python 3.10+ supports select(); older returns dict-like
-        group = eps.select(group=ENTRYPOINT_GROUP) if hasattr(eps, "select") else eps.get(ENTRYPOINT_GROUP, [])
-
-        for ep in group:
+        # Each registry still loads and instantiates its own analyzers
+        for ep in _analyzer_entrypoints():
             source = f"{ep.module}:{ep.attr}"
             try:
                 loaded_obj = ep.load()
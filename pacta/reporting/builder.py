@@ -209,14 +209,11 @@ class DefaultReportBuilder:
         )
 
     def _build_summary(self, violations: Sequence[Violation], engine_errors: Sequence[EngineError]) -> Summary:
-        by_sev = Counter()
-        by_status = Counter()
-        by_rule = Counter()
-
-        for v in violations:
-            by_sev[_severity_str(v.rule.severity)] += 1
-            by_status[str(v.status)] += 1
-            by_rule[str(v.rule.id)] += 1
+        # Counter(iterable) tallies in C, without a lookup-and-store per item
+        rules = [v.rule for v in violations]
+        by_sev = Counter(_severity_str(r.severity) for r in rules)
+        by_status = Counter(str(v.status) for v in violations)
+        by_rule = Counter(str(r.id) for r in rules)
 
         return Summary(
             total_violations=len(violations),
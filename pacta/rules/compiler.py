@@ -1,5 +1,6 @@
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any, cast
 
 from pacta.ir.select import match_glob, match_regex
@@ -31,6 +32,55 @@ class _CompiledWhen:
     predicate: PredicateFn
 
 
+# Field accessors, resolved once per compare at compile time
+
+_NODE_FIELDS: dict[str, Callable[[IRNode], Any]] = {
+    "symbol_kind": lambda n: n.kind.value,
+    "kind": attrgetter("container_kind"),
+    "within": attrgetter("within"),
+    "service": attrgetter("service"),
+    "path": attrgetter("path"),
+    "name": attrgetter("name"),
+    "layer": attrgetter("layer"),
+    "context": attrgetter("context"),
+    "container": attrgetter("container"),
+    "tags": attrgetter("tags"),
+    "fqname": attrgetter("id.fqname"),
+    "id.fqname": attrgetter("id.fqname"),
+    "id": lambda n: str(n.id),
+    "code_root": attrgetter("id.code_root"),
+    "language": lambda n: n.id.language.value,
+}
+
+_EDGE_FIELDS: dict[str, Callable[[IREdge], Any]] = {
+    "from.layer": attrgetter("src_layer"),
+    "to.layer": attrgetter("dst_layer"),
+    "from.context": attrgetter("src_context"),
+    "to.context": attrgetter("dst_context"),
+    "from.container": attrgetter("src_container"),
+    "to.container": attrgetter("dst_container"),
+    "from.service": attrgetter("src_service"),
+    "to.service": attrgetter("dst_service"),
+    "from.kind": attrgetter("src_container_kind"),
+    "to.kind": attrgetter("dst_container_kind"),
+    "from.within": attrgetter("src_within"),
+    "to.within": attrgetter("dst_within"),
+    "from.fqname": attrgetter("src.fqname"),
+    "to.fqname": attrgetter("dst.fqname"),
+    "from.id": lambda e: str(e.src),
+    "to.id": lambda e: str(e.dst),
+    "dep.type": lambda e: e.dep_type.value,
+    "loc.file": lambda e: None if e.loc is None else e.loc.file,
+}
+
+
+def _node_field_accessor(field: str) -> Callable[[IRNode], Any] | None:
+    f = field
+    if f.startswith("node."):
+        f = f[len("node.") :]
+    return _NODE_FIELDS.get(f)
+
+
 def _get_node_field(n: IRNode, field: str) -> Any:
     """
     Supported node fields (frontends may use either node.<x> or <x>):
@@ -49,40 +99,10 @@ def _get_node_field(n: IRNode, field: str) -> Any:
       - code_root (n.id.code_root)
       - language (n.id.language.value)
     """
-    f = field
-    if f.startswith("node."):
-        f = f[len("node.") :]
-
-    if f == "symbol_kind":
-        return n.kind.value
-    if f == "kind":
-        return n.container_kind
-    if f == "within":
-        return n.within
-    if f == "service":
-        return n.service
-    if f == "path":
-        return n.path
-    if f == "name":
-        return n.name
-    if f == "layer":
-        return n.layer
-    if f == "context":
-        return n.context
-    if f == "container":
-        return n.container
-    if f == "tags":
-        return n.tags
-    if f in ("fqname", "id.fqname"):
-        return n.id.fqname
-    if f == "id":
-        return str(n.id)
-    if f == "code_root":
-        return n.id.code_root
-    if f == "language":
-        return n.id.language.value
-
-    raise KeyError(f"Unknown node field: {field}")
+    accessor = _node_field_accessor(field)
+    if accessor is None:
+        raise KeyError(f"Unknown node field: {field}")
+    return accessor(n)
 
 
 def _get_edge_field(e: IREdge, field: str) -> Any:
@@ -99,55 +119,10 @@ def _get_edge_field(e: IREdge, field: str) -> Any:
       - dep.type (DepType.value)
       - loc.file (if loc is present)
     """
-    f = field.strip()
-
-    if f == "from.layer":
-        return e.src_layer
-    if f == "to.layer":
-        return e.dst_layer
-
-    if f == "from.context":
-        return e.src_context
-    if f == "to.context":
-        return e.dst_context
-
-    if f == "from.container":
-        return e.src_container
-    if f == "to.container":
-        return e.dst_container
-
-    if f == "from.service":
-        return e.src_service
-    if f == "to.service":
-        return e.dst_service
-
-    if f == "from.kind":
-        return e.src_container_kind
-    if f == "to.kind":
-        return e.dst_container_kind
-
-    if f == "from.within":
-        return e.src_within
-    if f == "to.within":
-        return e.dst_within
-
-    if f == "from.fqname":
-        return e.src.fqname
-    if f == "to.fqname":
-        return e.dst.fqname
-
-    if f == "from.id":
-        return str(e.src)
-    if f == "to.id":
-        return str(e.dst)
-
-    if f == "dep.type":
-        return e.dep_type.value
-
-    if f == "loc.file":
-        return None if e.loc is None else e.loc.file
-
-    raise KeyError(f"Unknown dependency field: {field}")
+    accessor = _EDGE_FIELDS.get(field.strip())
+    if accessor is None:
+        raise KeyError(f"Unknown dependency field: {field}")
+    return accessor(e)
 
 
 # Literal coercion
@@ -283,13 +258,28 @@ class RulesCompiler:
         return _CompiledWhen(target=target, predicate=pred)
 
     def _compile_expr(self, expr: ExprAst, target: RuleTarget, r: RuleAst) -> PredicateFn:
+        # Plain loops: all()/any() over a generator cost a frame per call
         if isinstance(expr, AndAst):
             items = [self._compile_expr(x, target, r) for x in expr.items]
-            return lambda obj: all(p(obj) for p in items)
+
+            def all_of(obj: object) -> bool:
+                for p in items:
+                    if not p(obj):
+                        return False
+                return True
+
+            return all_of
 
         if isinstance(expr, OrAst):
             items = [self._compile_expr(x, target, r) for x in expr.items]
-            return lambda obj: any(p(obj) for p in items)
+
+            def any_of(obj: object) -> bool:
+                for p in items:
+                    if p(obj):
+                        return True
+                return False
+
+            return any_of
 
         if isinstance(expr, NotAst):
             if expr.item is None:
@@ -312,6 +302,11 @@ class RulesCompiler:
             rhs = _lit_value(right)
             op_fn = _OPS[op]
 
+            # Equality is the common case; compare inline
+            if op_fn is _op_eq:
+                return lambda obj: getter(obj) == rhs
+            if op_fn is _op_neq:
+                return lambda obj: getter(obj) != rhs
             return lambda obj: op_fn(getter(obj), rhs)
 
         raise self._err(f"Unsupported expression node: {type(expr).__name__}", r)
@@ -322,7 +317,11 @@ class RulesCompiler:
             raise self._err("Empty field reference", r)
 
         if target == RuleTarget.NODE:
+            accessor = _node_field_accessor(path)
+            if accessor is not None:
+                return cast(Callable[[object], Any], accessor)
 
+            # Unknown field: raised when the predicate runs, as before
             def getter(obj: object) -> Any:
                 n = cast(IRNode, obj)
                 try:
@@ -333,6 +332,9 @@ class RulesCompiler:
             return getter
 
         if target == RuleTarget.DEPENDENCY:
+            edge_accessor = _EDGE_FIELDS.get(path)
+            if edge_accessor is not None:
+                return cast(Callable[[object], Any], edge_accessor)
 
             def getter(obj: object) -> Any:
                 e = cast(IREdge, obj)
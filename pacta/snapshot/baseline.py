@@ -101,8 +101,8 @@ class DefaultBaselineService:
         out: list[Any] = []
         new = existing = fixed = unknown = 0
 
-        for v in current_violations:
-            k = self._violation_key(v, key_fn=key_fn)
+        # Keys were computed once above; reuse them rather than calling key_fn again
+        for v, k in zip(current_violations, cur_keys, strict=True):
             if not k:
                 out.append(_set_status(v, "unknown"))
                 unknown += 1
@@ -4,6 +4,11 @@ from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 def _is_pydantic_model(obj: Any) -> bool:
     # pydantic v1: .dict() ; pydantic v2: .model_dump()
@@ -61,4 +66,17 @@ def dump_file(path: Path, data: Any) -> None:
 
 
 def load_file(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    """
+    Parse a JSON file, with orjson when it is installed (pacta[speedups]).
+
+    Both parsers take the raw bytes, skipping a separate decode pass. orjson is
+    stricter (no NaN/Infinity, 64-bit integers only), so a document it rejects
+    is retried with the stdlib parser before the error is reported.
+    """
+    data = path.read_bytes()
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
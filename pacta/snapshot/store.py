@@ -14,10 +14,16 @@ Storage layout:
 
 Every save creates a new object file (hash of content).
 Refs are aliases pointing to object hashes.
+
+Per-object metadata and counts are also appended to a machine-local index
+(.pacta/cache/snapshots.jsonl) so history summaries don't need to load every
+snapshot. The index is only a cache: entries are checked against the object
+file's mtime/size and rebuilt from the object when they don't match.
 """
 
 import hashlib
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -27,6 +33,9 @@ from pacta.snapshot.types import Snapshot, SnapshotRef
 # Length of hash prefix used for object filenames
 HASH_PREFIX_LENGTH = 8
 
+# Fields of an ObjectStats index line (besides the file mtime/size it was taken from)
+_STATS_FIELDS = ("short_hash", "created_at", "commit", "branch", "node_count", "edge_count", "violation_count")
+
 
 @dataclass(frozen=True)
 class SaveResult:
@@ -38,6 +47,32 @@ class SaveResult:
     refs_updated: tuple[str, ...]  # Refs that were created/updated
 
 
+@dataclass(frozen=True)
+class ObjectStats:
+    """Metadata and counts of a stored snapshot, available without loading it."""
+
+    short_hash: str
+    created_at: str | None
+    commit: str | None
+    branch: str | None
+    node_count: int
+    edge_count: int
+    violation_count: int
+
+    @staticmethod
+    def of(short_hash: str, snapshot: Snapshot) -> "ObjectStats":
+        meta = snapshot.meta
+        return ObjectStats(
+            short_hash=short_hash,
+            created_at=meta.created_at,
+            commit=meta.commit,
+            branch=meta.branch,
+            node_count=len(snapshot.nodes),
+            edge_count=len(snapshot.edges),
+            violation_count=len(snapshot.violations),
+        )
+
+
 class FsSnapshotStore:
     """
     Content-addressed snapshot store with git-like refs.
@@ -46,11 +81,23 @@ class FsSnapshotStore:
     Refs are mutable pointers to object hashes.
     """
 
-    def __init__(self, repo_root: str, *, base_dir: str = ".pacta/snapshots") -> None:
+    def __init__(
+        self,
+        repo_root: str | Path,
+        *,
+        base_dir: str = ".pacta/snapshots",
+        index_file: str = ".pacta/cache/snapshots.jsonl",
+    ) -> None:
         self._repo_root = Path(repo_root)
         self._base_dir = self._repo_root / base_dir
         self._objects_dir = self._base_dir / "objects"
         self._refs_dir = self._base_dir / "refs"
+        self._index_path = self._repo_root / index_file
+        # (signature, ref_name -> hash, hash -> ref names) from the last refs read
+        self._refs_cache: tuple[tuple[tuple[str, int, int], ...], dict[str, str], dict[str, list[str]]] | None = None
+        # (signature, listing) from the last list_objects(); valid while the
+        # (name, mtime_ns, size) listing of the object files is unchanged
+        self._list_cache: tuple[tuple[tuple[str, int, int], ...], list[tuple[str, Snapshot]]] | None = None
 
     def _compute_hash(self, snapshot: Snapshot) -> str:
         """Compute SHA256 hash of snapshot content."""
@@ -93,6 +140,7 @@ class FsSnapshotStore:
             json.dumps(data, sort_keys=True, indent=2, ensure_ascii=False) + "\n",
             encoding="utf-8",
         )
+        self._index_stats(ObjectStats.of(short_hash, snapshot), object_path)
 
         # Update refs if specified
         refs_updated: list[str] = []
@@ -127,6 +175,7 @@ class FsSnapshotStore:
             json.dumps(data, sort_keys=True, indent=2, ensure_ascii=False) + "\n",
             encoding="utf-8",
         )
+        self._index_stats(ObjectStats.of(short_hash, snapshot), path)
 
     def load_object(self, short_hash: str) -> Snapshot:
         """Load snapshot by short hash."""
@@ -142,6 +191,24 @@ class FsSnapshotStore:
         """Check if object exists by short hash."""
         return self._object_path(short_hash).exists()
 
+    def has_objects(self, count: int = 1) -> bool:
+        """
+        Check whether at least `count` objects are stored.
+
+        Only reads directory entries, stopping as soon as `count` are seen.
+        """
+        seen = 0
+        try:
+            with os.scandir(self._objects_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        seen += 1
+                        if seen >= count:
+                            return True
+        except OSError:
+            return False
+        return seen >= count
+
     def list_objects(self) -> list[tuple[str, Snapshot]]:
         """
         List all objects sorted by created_at timestamp (newest first).
@@ -152,9 +219,15 @@ class FsSnapshotStore:
         if not self._objects_dir.exists():
             return []
 
+        # One stat per file decides whether the previous listing is still valid
+        signature = self._objects_signature()
+        cached = self._list_cache
+        if cached is not None and cached[0] == signature:
+            return list(cached[1])
+
         objects: list[tuple[str, Snapshot]] = []
-        for path in self._objects_dir.glob("*.json"):
-            short_hash = path.stem
+        for name, _, _ in signature:
+            short_hash = name[: -len(".json")]
             try:
                 snapshot = self.load_object(short_hash)
                 objects.append((short_hash, snapshot))
@@ -167,7 +240,114 @@ class FsSnapshotStore:
             key=lambda x: x[1].meta.created_at or "",
             reverse=True,
         )
-        return objects
+        self._list_cache = (signature, objects)
+        return list(objects)
+
+    def _objects_signature(self) -> tuple[tuple[str, int, int], ...]:
+        """(name, mtime_ns, size) of every object file, sorted by name."""
+        entries: list[tuple[str, int, int]] = []
+        try:
+            with os.scandir(self._objects_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((entry.name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            return ()
+        entries.sort()
+        return tuple(entries)
+
+    def list_object_stats(self) -> list[ObjectStats]:
+        """
+        Like list_objects(), but only metadata and counts (newest first).
+
+        Served from the stats index; objects that are missing from it or have
+        changed since they were indexed are loaded once and re-indexed.
+        """
+        if not self._objects_dir.exists():
+            return []
+
+        index, n_lines = self._read_index()
+
+        stats: list[ObjectStats] = []
+        for path in self._objects_dir.glob("*.json"):
+            short_hash = path.stem
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+
+            cached = index.get(short_hash)
+            if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+                stats.append(cached[1])
+                continue
+
+            try:
+                entry = ObjectStats.of(short_hash, self.load_object(short_hash))
+            except Exception:
+                # Skip corrupted files
+                continue
+            self._index_stats(entry, path)
+            stats.append(entry)
+
+        # Entries for deleted objects or superseded by re-indexing pile up in the
+        # append-only index; rewrite it once they outnumber the live ones
+        if n_lines > 2 * len(stats) + 16:
+            self._rewrite_index(stats)
+
+        # Same order as list_objects(): by name, then (stably) newest first
+        stats.sort(key=lambda x: x.short_hash)
+        stats.sort(key=lambda x: x.created_at or "", reverse=True)
+        return stats
+
+    def _read_index(self) -> tuple[dict[str, tuple[tuple[int, int], ObjectStats]], int]:
+        """Index entries by short hash (last line wins) and the index line count."""
+        index: dict[str, tuple[tuple[int, int], ObjectStats]] = {}
+        n_lines = 0
+        try:
+            with open(self._index_path, encoding="utf-8") as fh:
+                for line in fh:
+                    n_lines += 1
+                    try:
+                        row = json.loads(line)
+                        entry = ObjectStats(**{name: row[name] for name in _STATS_FIELDS})
+                        index[entry.short_hash] = ((row["mtime_ns"], row["size"]), entry)
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+        return index, n_lines
+
+    def _index_line(self, entry: ObjectStats, path: Path) -> str:
+        st = path.stat()
+        row = {name: getattr(entry, name) for name in _STATS_FIELDS}
+        row["mtime_ns"] = st.st_mtime_ns
+        row["size"] = st.st_size
+        return json.dumps(row, sort_keys=True) + "\n"
+
+    def _index_stats(self, entry: ObjectStats, path: Path) -> None:
+        """Append one entry to the stats index (best-effort: it is only a cache)."""
+        try:
+            line = self._index_line(entry, path)
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._index_path, "a", encoding="utf-8") as fh:
+                fh.write(line)
+        except OSError:
+            pass
+
+    def _rewrite_index(self, stats: list[ObjectStats]) -> None:
+        """Replace the stats index with one line per live object."""
+        try:
+            lines = [self._index_line(entry, self._object_path(entry.short_hash)) for entry in stats]
+            tmp = self._index_path.with_name(self._index_path.name + ".tmp")
+            tmp.write_text("".join(lines), encoding="utf-8")
+            tmp.replace(self._index_path)
+        except OSError:
+            pass
 
     def _ref_path(self, ref_name: str) -> Path:
         """Get path to ref file."""
@@ -178,6 +358,7 @@ class FsSnapshotStore:
         ref_path = self._ref_path(ref_name)
         ref_path.parent.mkdir(parents=True, exist_ok=True)
         ref_path.write_text(short_hash + "\n", encoding="utf-8")
+        self._refs_cache = None
 
     def resolve_ref(self, ref_name: str) -> str | None:
         """Resolve a ref name to its target hash."""
@@ -197,20 +378,61 @@ class FsSnapshotStore:
         Returns:
             Dict mapping ref_name -> short_hash
         """
-        if not self._refs_dir.exists():
-            return {}
+        return dict(self._read_refs()[1])
+
+    def refs_by_hash(self) -> dict[str, list[str]]:
+        """
+        Refs grouped by the hash they point to (the inverse of list_refs()).
+
+        Returns:
+            Dict mapping short_hash -> [ref_name, ...]
+        """
+        # Lists copied too: callers may edit them, the memo must not change
+        return {short_hash: list(names) for short_hash, names in self._read_refs()[2].items()}
+
+    def _read_refs(self) -> tuple[tuple[tuple[str, int, int], ...], dict[str, str], dict[str, list[str]]]:
+        """Refs and their inversion; ref files are only re-read when one has changed."""
+        signature = self._refs_signature()
+        cached = self._refs_cache
+        if cached is not None and cached[0] == signature:
+            return cached
 
         refs: dict[str, str] = {}
-        for path in self._refs_dir.iterdir():
-            if path.is_file():
-                refs[path.name] = path.read_text(encoding="utf-8").strip()
-        return refs
+        by_hash: dict[str, list[str]] = {}
+        for name, _, _ in signature:
+            try:
+                short_hash = (self._refs_dir / name).read_text(encoding="utf-8").strip()
+            except OSError:
+                continue
+            refs[name] = short_hash
+            by_hash.setdefault(short_hash, []).append(name)
+
+        self._refs_cache = (signature, refs, by_hash)
+        return self._refs_cache
+
+    def _refs_signature(self) -> tuple[tuple[str, int, int], ...]:
+        """(name, mtime_ns, size) of every ref file, in directory order."""
+        entries: list[tuple[str, int, int]] = []
+        try:
+            with os.scandir(self._refs_dir) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((entry.name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            return ()
+        return tuple(entries)
 
     def delete_ref(self, ref_name: str) -> bool:
         """Delete a ref. Returns True if deleted, False if didn't exist."""
         ref_path = self._ref_path(ref_name)
         if ref_path.exists():
             ref_path.unlink()
+            self._refs_cache = None
             return True
         return False
 
@@ -1,3 +1,6 @@
+import os
+import pickle
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 import pytest
@@ -185,6 +188,23 @@ def test_default_excludes_are_applied(repo: Path, analyzer: PythonAnalyzer) -> N
     assert not any(p.startswith(".git/") for p in paths)
 
 
+def test_excluded_directories_are_not_descended(
+    repo: Path, analyzer: PythonAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    scanned: list[str] = []
+    real_scandir = os.scandir
+
+    def _recording_scandir(path):
+        scanned.append(Path(path).relative_to(repo.resolve()).as_posix())
+        return real_scandir(path)
+
+    monkeypatch.setattr("pacta.analyzers.python.os.scandir", _recording_scandir)
+    analyzer.analyze(AnalyzeConfig(repo_root=repo))
+
+    assert "app" in scanned
+    assert not any(p.startswith((".venv", "__pycache__", ".git")) for p in scanned)
+
+
 # ----------------------------
 # analyze: target scoping
 # ----------------------------
@@ -351,6 +371,39 @@ def test_external_imports_create_nodes_without_paths(repo: Path, analyzer: Pytho
     assert any(n.path is None for n in ir.nodes)
 
 
+def test_nested_imports_are_found(tmp_path: Path, analyzer: PythonAnalyzer) -> None:
+    _w(tmp_path / "a.py", "")
+    _w(tmp_path / "b.py", "")
+    _w(tmp_path / "c.py", "")
+    _w(
+        tmp_path / "m.py",
+        """
+try:
+    import a
+except ImportError:
+    import b
+
+class K:
+    def f(self):
+        import c
+""".strip()
+        + "\n",
+    )
+    ir = analyzer.analyze(AnalyzeConfig(repo_root=tmp_path))
+
+    _assert_edge(ir, "m.py", "a.py")
+    _assert_edge(ir, "m.py", "b.py")
+    _assert_edge(ir, "m.py", "c.py")
+
+
+def test_coding_cookie_is_honoured(tmp_path: Path, analyzer: PythonAnalyzer) -> None:
+    _w(tmp_path / "a.py", "")
+    _wb(tmp_path / "m.py", b"# -*- coding: latin-1 -*-\nimport a\nNAME = '\xe9'\n")
+    ir = analyzer.analyze(AnalyzeConfig(repo_root=tmp_path))
+
+    _assert_edge(ir, "m.py", "a.py")
+
+
 # ----------------------------
 # Determinism (very important)
 # ----------------------------
@@ -375,6 +428,152 @@ def test_non_deterministic_mode_still_produces_valid_ir(repo: Path, analyzer: Py
     _assert_all_edge_endpoints_exist(ir)
 
 
+def test_parallel_parsing_matches_serial(
+    repo: Path, analyzer: PythonAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    serial = analyzer.analyze(AnalyzeConfig(repo_root=repo, language_options={"python": {"jobs": 1}})).to_dict()
+
+    monkeypatch.setattr(PythonAnalyzer, "_PARALLEL_MIN_FILES", 1)
+    parallel = analyzer.analyze(AnalyzeConfig(repo_root=repo, language_options={"python": {"jobs": 2}})).to_dict()
+
+    assert parallel == serial
+
+
+def test_broken_process_pool_falls_back_to_serial(
+    repo: Path, analyzer: PythonAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    serial = analyzer.analyze(AnalyzeConfig(repo_root=repo, language_options={"python": {"jobs": 1}})).to_dict()
+
+    class _DeadPool:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(PythonAnalyzer, "_PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr("pacta.analyzers.python.ProcessPoolExecutor", _DeadPool)
+    parallel = analyzer.analyze(AnalyzeConfig(repo_root=repo, language_options={"python": {"jobs": 2}})).to_dict()
+
+    assert parallel == serial
+
+
+def test_cache_dir_reuses_parse_results(
+    repo: Path, tmp_path_factory: pytest.TempPathFactory, analyzer: PythonAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = tmp_path_factory.mktemp("cache")
+    cfg = AnalyzeConfig(repo_root=repo, cache_dir=cache_dir)
+
+    first = analyzer.analyze(cfg).to_dict()
+    assert any((cache_dir / "python").rglob("*"))
+
+    # a warm cache must not need the parser at all
+    def _fail(*args, **kwargs):
+        raise AssertionError("ast.parse called despite warm cache")
+
+    monkeypatch.setattr("pacta.analyzers.python.ast.parse", _fail)
+    assert analyzer.analyze(cfg).to_dict() == first
+
+
+def test_full_scan_prunes_unused_cache_entries(
+    repo: Path, tmp_path_factory: pytest.TempPathFactory, analyzer: PythonAnalyzer
+) -> None:
+    cache_dir = tmp_path_factory.mktemp("cache")
+    cfg = AnalyzeConfig(repo_root=repo, cache_dir=cache_dir)
+
+    analyzer.analyze(cfg)
+    before = {p for p in (cache_dir / "python").rglob("*") if p.is_file()}
+
+    _w(repo / "app" / "c.py", "from .b import B  # edited\nclass C(B): ...\n")
+    stray = cache_dir / "python" / "zz" / "stale"
+    _w(stray, "[]")
+
+    # a partial scan keeps entries for files it didn't look at
+    partial = AnalyzeTarget(include_paths=(repo / "app",))
+    analyzer.analyze(AnalyzeConfig(repo_root=repo, cache_dir=cache_dir, target=partial))
+    assert stray.exists()
+
+    analyzer.analyze(cfg)
+    after = {p for p in (cache_dir / "python").rglob("*") if p.is_file()}
+    assert not stray.exists()
+    assert len(after) == len(before)
+    assert len(after - before) == 1
+
+
+class _Boom:
+    def __reduce__(self):
+        return (os.system, ("exit 1",))
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pickle.dumps(_Boom()),
+        b"not json",
+        b'{"rows": []}',
+        b'[["import", "os", null, 0, 1]]',
+        b'[["exec", "os", null, 0, 1, 0]]',
+        b'[["import", "os", null, "0", 1, 0]]',
+    ],
+    ids=["pickle", "garbage", "object", "short-row", "bad-kind", "bad-int"],
+)
+def test_corrupt_cache_entries_are_misses(
+    repo: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    analyzer: PythonAnalyzer,
+    monkeypatch: pytest.MonkeyPatch,
+    payload: bytes,
+) -> None:
+    cache_dir = tmp_path_factory.mktemp("cache")
+    cfg = AnalyzeConfig(repo_root=repo, cache_dir=cache_dir)
+    expected = analyzer.analyze(AnalyzeConfig(repo_root=repo)).to_dict()
+
+    analyzer.analyze(cfg)
+    entries = [p for p in (cache_dir / "python").rglob("*") if p.is_file()]
+    assert entries
+    for entry in entries:
+        entry.write_bytes(payload)
+
+    # entries are never unpickled, whatever they contain
+    monkeypatch.setattr("pickle.loads", lambda *a, **k: pytest.fail("cache entry unpickled"))
+    monkeypatch.setattr("pickle.load", lambda *a, **k: pytest.fail("cache entry unpickled"))
+    assert analyzer.analyze(cfg).to_dict() == expected
+
+
+def test_default_excludes_use_prebuilt_regexes(
+    repo: Path, analyzer: PythonAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = analyzer.analyze(AnalyzeConfig(repo_root=repo)).to_dict()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("default exclude globs recompiled")
+
+    monkeypatch.setattr(PythonAnalyzer, "_compile_exclude_set", _fail)
+    assert analyzer.analyze(AnalyzeConfig(repo_root=repo)).to_dict() == expected
+
+
+def test_files_without_imports_are_not_parsed(
+    tmp_path: Path, analyzer: PythonAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _w(tmp_path / "pkg" / "__init__.py", "")
+    _w(tmp_path / "pkg" / "consts.py", "X = 1\n")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("ast.parse called for an import-free file")
+
+    monkeypatch.setattr("pacta.analyzers.python.ast.parse", _fail)
+    ir = analyzer.analyze(AnalyzeConfig(repo_root=tmp_path))
+
+    assert {n.path for n in ir.nodes} == {"pkg/__init__.py", "pkg/consts.py"}
+    assert ir.edges == ()
+
+
 # ----------------------------
 # produced_by / plugin_id expectations
 # ----------------------------
@@ -298,6 +298,54 @@ class TestArgumentParsing:
         assert exit_code == 0
         assert mock_scan.call_args.kwargs["mode"] == "changed_only"
 
+    def test_scan_no_cache(self, tmp_path):
+        """Test that --no-cache reaches the engine adapter."""
+        repo_root = tmp_path / "repo"
+        repo_root.mkdir()
+
+        mock_report = create_test_report(repo_root)
+
+        with patch("pacta.cli.scan.run_engine_scan", return_value=mock_report) as mock_scan:
+            assert main(["scan", str(repo_root)]) == 0
+            assert mock_scan.call_args.kwargs["cache"] is True
+
+            assert main(["scan", str(repo_root), "--no-cache"]) == 0
+            assert mock_scan.call_args.kwargs["cache"] is False
+
+    def test_scan_jobs(self, tmp_path):
+        """Test that --jobs reaches the engine adapter."""
+        repo_root = tmp_path / "repo"
+        repo_root.mkdir()
+
+        mock_report = create_test_report(repo_root)
+
+        with patch("pacta.cli.scan.run_engine_scan", return_value=mock_report) as mock_scan:
+            assert main(["scan", str(repo_root)]) == 0
+            assert mock_scan.call_args.kwargs["jobs"] is None
+
+            assert main(["scan", str(repo_root), "--jobs", "1"]) == 0
+            assert mock_scan.call_args.kwargs["jobs"] == 1
+
+    def test_only_requested_subcommand_parser_is_built(self):
+        """Test that build_parser(cmd) registers just that subcommand."""
+        from pacta.cli.main import _peek_command, build_parser
+
+        assert _peek_command(["--version", "scan", "history", "show"]) == "history"
+        assert _peek_command(["-h", "scan"]) is None
+
+        args = build_parser("history").parse_args(["history", "show", "--last", "2"])
+        assert (args.cmd, args.history_cmd, args.last) == ("history", "show", 2)
+
+    def test_root_version_option_before_subcommand(self):
+        """Test that --version ahead of the subcommand still reaches it."""
+        with patch("pacta.cli.scan.run_engine_scan") as mock_scan:
+            mock_scan.return_value = create_test_report(".")
+
+            exit_code = main(["--version", "9.9", "scan"])
+
+        assert exit_code == 0
+        assert mock_scan.call_args.kwargs["tool_version"] == "9.9"
+
 
 class TestHumanReadableOutput:
     """Tests for human-readable violation output (always enabled by default)."""
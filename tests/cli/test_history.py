@@ -2,6 +2,7 @@
 Tests for the history CLI commands.
 """
 
+import io
 import json
 from pathlib import Path
 
@@ -84,6 +85,53 @@ class TestHistoryShow:
         data = json.loads(captured.out)
         assert data["count"] == 2
 
+    def test_show_loads_only_listed_snapshots(self, repo_with_history: Path, capsys, monkeypatch):
+        """history show should filter on indexed metadata and load only the entries it prints."""
+        from pacta.cli.history import show
+
+        loaded: list[str] = []
+        load_object = FsSnapshotStore.load_object
+
+        def counting_load(self, short_hash):
+            loaded.append(short_hash)
+            return load_object(self, short_hash)
+
+        monkeypatch.setattr(FsSnapshotStore, "load_object", counting_load)
+
+        show(path=str(repo_with_history), format="text")
+        capsys.readouterr()
+        assert loaded == []
+
+        show(path=str(repo_with_history), last=1, format="json")
+        data = json.loads(capsys.readouterr().out)
+        assert loaded == [data["entries"][0]["hash"]]
+
+    def test_show_json_counts_violations_by_severity(self, tmp_path: Path, capsys):
+        """history show --format json should count parsed and raw-dict violations by severity."""
+        from dataclasses import replace
+
+        from pacta.cli.history import show
+        from pacta.reporting.types import RuleRef, Severity, Violation
+
+        def violation(severity: Severity) -> Violation:
+            return Violation(rule=RuleRef(id="r", name="R", severity=severity), message="m")
+
+        store = FsSnapshotStore(repo_root=str(tmp_path))
+        builder = DefaultSnapshotBuilder()
+        parsed = (violation(Severity.ERROR), violation(Severity.WARNING), violation(Severity.ERROR))
+        for i, violations in enumerate([parsed, (*parsed, {"rule": {"severity": "info"}})]):
+            meta = SnapshotMeta(repo_root=str(tmp_path), created_at=f"2025-01-0{i + 1}T12:00:00+00:00")
+            snap = builder.build({"nodes": [make_node("a")], "edges": []}, meta=meta)
+            store.save(replace(snap, violations=violations))
+
+        show(path=str(tmp_path), format="json")
+        data = json.loads(capsys.readouterr().out)
+
+        assert [e["violations_by_severity"] for e in data["entries"]] == [
+            {"error": 2, "warning": 1, "info": 1},
+            {"error": 2, "warning": 1},
+        ]
+
     def test_show_branch_filter(self, repo_with_history: Path, capsys):
         """history show --branch should filter by branch."""
         from pacta.cli.history import show
@@ -163,6 +211,88 @@ class TestHistoryExport:
             assert "hash" in data
             assert "timestamp" in data
 
+    def test_export_keeps_unparsed_violations(self, tmp_path: Path, capsys):
+        """history export should write parsed violations via to_dict() next to raw dict ones."""
+        from dataclasses import replace
+
+        from pacta.cli.history import export
+        from pacta.reporting.types import RuleRef, Severity, Violation
+
+        parsed = Violation(rule=RuleRef(id="r", name="R", severity=Severity.ERROR), message="m")
+        raw = {"rule": {"severity": "info"}}
+        meta = SnapshotMeta(repo_root=str(tmp_path), created_at="2025-01-01T12:00:00+00:00")
+        snap = DefaultSnapshotBuilder().build({"nodes": [make_node("a")], "edges": []}, meta=meta)
+        FsSnapshotStore(repo_root=str(tmp_path)).save(replace(snap, violations=(parsed, raw)))
+
+        export(path=str(tmp_path), format="jsonl")
+        (entry,) = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+        assert entry["violations"] == [parsed.to_dict(), raw]
+
+    def test_export_without_orjson_matches(self, repo_with_history: Path, capsys, monkeypatch):
+        """The stdlib JSON fallback should export the same entries as orjson."""
+        import pacta.cli._json as cli_json
+        from pacta.cli.history import export
+
+        export(path=str(repo_with_history), format="jsonl")
+        first = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+        monkeypatch.setattr(cli_json, "_orjson", None)
+        export(path=str(repo_with_history), format="jsonl")
+        second = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+        assert first == second
+        assert len(second) == 3
+
+    def test_indented_json_same_with_either_encoder(self, monkeypatch):
+        """Indented output, non-ASCII included, should not depend on orjson being installed."""
+        import pacta.cli._json as cli_json
+
+        doc = {"branch": "feat/ünïcode-✓", "refs": ["latest"], "count": 3, "density": 0.25}
+        with_orjson = cli_json.dumps(doc, indent=True)
+        monkeypatch.setattr(cli_json, "_orjson", None)
+
+        assert cli_json.dumps(doc, indent=True) == with_orjson
+        assert "ü" in with_orjson
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_output_is_utf8_on_legacy_encoded_stream(self, monkeypatch, use_orjson):
+        """Non-ASCII JSON should reach a cp1252 stream as UTF-8 bytes instead of failing to encode."""
+        import pacta.cli._json as cli_json
+        from pacta.cli.history import _write_export_document
+
+        if not use_orjson:
+            monkeypatch.setattr(cli_json, "_orjson", None)
+        doc = {"branch": "feat/✓"}
+
+        for write in (
+            lambda stream: cli_json.write_json(doc, stream, indent=True),
+            lambda stream: _write_export_document(stream, {"version": 1}, iter([doc])),
+        ):
+            raw = io.BytesIO()
+            stream = io.TextIOWrapper(raw, encoding="cp1252")
+            write(stream)
+            stream.flush()
+            assert "feat/✓" in raw.getvalue().decode("utf-8")
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_export_json_streamed_layout(
+        self, repo_with_history: Path, tmp_path: Path, capsys, monkeypatch, use_orjson
+    ):
+        """The streamed JSON export should match a single indent=2 dump, also with no entries."""
+        import pacta.cli._json as cli_json
+        from pacta.cli.history import export
+
+        if not use_orjson:
+            monkeypatch.setattr(cli_json, "_orjson", None)
+        empty_repo = tmp_path / "empty"
+        empty_repo.mkdir()
+
+        for repo in (repo_with_history, empty_repo):
+            export(path=str(repo), format="json")
+            out = capsys.readouterr().out
+            assert out == json.dumps(json.loads(out), indent=2, ensure_ascii=False) + "\n"
+
     def test_export_to_file(self, repo_with_history: Path, tmp_path: Path):
         """history export -o should write to file."""
         from pacta.cli.history import export
@@ -281,6 +411,59 @@ class TestHistoryTrends:
         assert "Last:" in captured.out
 
 
+class TestAttachTrends:
+    """Tests for the trend summary attached to GitHub reports."""
+
+    @staticmethod
+    def _report(repo_root: Path):
+        from pacta.reporting.types import Report, RunInfo, Summary
+
+        run = RunInfo(
+            repo_root=str(repo_root),
+            commit=None,
+            branch=None,
+            model_file=None,
+            rules_files=(),
+            baseline_ref=None,
+            mode="full",
+            created_at=None,
+            tool_version=None,
+            metadata={},
+        )
+        summary = Summary(total_violations=0, by_severity={}, by_status={}, by_rule={}, engine_errors=0)
+        return Report(tool="pacta", version="test", run=run, summary=summary)
+
+    def test_attaches_trends_from_history(self, repo_with_history: Path):
+        """attach_trends should summarize the stored snapshots."""
+        from pacta.cli._trends import attach_trends
+
+        report = attach_trends(self._report(repo_with_history), repo_root=str(repo_with_history))
+
+        assert report.trends is not None
+        assert len(report.trends.points) == 3
+
+    def test_single_snapshot_has_no_trends(self, tmp_path: Path):
+        """A single snapshot is not enough history for a trend."""
+        from pacta.cli._trends import attach_trends
+
+        store = FsSnapshotStore(repo_root=str(tmp_path))
+        meta = SnapshotMeta(repo_root=str(tmp_path), created_at="2025-01-01T12:00:00+00:00")
+        store.save(DefaultSnapshotBuilder().build({"nodes": [make_node("a")], "edges": []}, meta=meta))
+
+        assert store.has_objects(1)
+        assert not store.has_objects(2)
+        assert attach_trends(self._report(tmp_path), repo_root=str(tmp_path)).trends is None
+
+    def test_skip_trends_env(self, repo_with_history: Path, monkeypatch: pytest.MonkeyPatch):
+        """PACTA_SKIP_TRENDS should leave the report without trends."""
+        from pacta.cli._trends import SKIP_TRENDS_ENV, attach_trends
+
+        monkeypatch.setenv(SKIP_TRENDS_ENV, "1")
+        report = attach_trends(self._report(repo_with_history), repo_root=str(repo_with_history))
+
+        assert report.trends is None
+
+
 class TestAsciiChart:
     """Tests for ASCII chart rendering."""
 
@@ -389,6 +572,25 @@ class TestTrendsImageExport:
         assert output_file.exists()
         assert output_file.stat().st_size > 0
 
+    def test_long_svg_series_rasterizes_data(self, tmp_path: Path, capsys):
+        """SVG export should embed the data as an image only for long series."""
+        from pacta.cli._mpl_chart import is_matplotlib_available
+
+        if not is_matplotlib_available():
+            pytest.skip("matplotlib not installed")
+
+        from pacta.cli._mpl_chart import _VECTOR_MAX_POINTS, render_trends_chart
+
+        short_file = tmp_path / "short.svg"
+        render_trends_chart([1, 3, 2], ["a", "b", "c"], metric="nodes", output_path=str(short_file))
+        assert "<image" not in short_file.read_text()
+
+        n = _VECTOR_MAX_POINTS + 1
+        long_file = tmp_path / "long.svg"
+        render_trends_chart([i % 7 for i in range(n)], [""] * n, metric="nodes", output_path=str(long_file))
+        assert "<image" in long_file.read_text()
+        assert "rasterized" in capsys.readouterr().err
+
     def test_matplotlib_import_error_message(self):
         """Should raise ImportError with helpful message if matplotlib missing."""
         from pacta.cli._mpl_chart import is_matplotlib_available
@@ -424,6 +626,33 @@ class TestSnapshotStoreListObjects:
         timestamps = [snap.meta.created_at for _, snap in objects]
         assert timestamps == sorted(timestamps, reverse=True)
 
+    def test_list_objects_reuses_unchanged_listing(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """list_objects should not reload snapshots until an object file changes."""
+        builder = DefaultSnapshotBuilder()
+        store = FsSnapshotStore(repo_root=str(tmp_path))
+
+        def save(key: str) -> None:
+            meta = SnapshotMeta(repo_root=str(tmp_path), created_at=f"2025-01-0{len(key)}T12:00:00+00:00")
+            store.save(builder.build({"nodes": [make_node(key)], "edges": []}, meta=meta))
+
+        save("a")
+        first = store.list_objects()
+
+        loads: list[str] = []
+        real_load = FsSnapshotStore.load_object
+        monkeypatch.setattr(FsSnapshotStore, "load_object", lambda self, h: loads.append(h) or real_load(self, h))
+
+        assert store.list_objects() == first
+        assert loads == []
+
+        save("bb")
+        assert len(store.list_objects()) == 2
+        assert len(loads) == 2
+
+        # The memo belongs to the instance: a new store loads for itself
+        assert len(FsSnapshotStore(repo_root=str(tmp_path)).list_objects()) == 2
+        assert len(loads) == 4
+
     def test_list_objects_empty_store(self, tmp_path: Path):
         """list_objects on empty store should return empty list."""
         store = FsSnapshotStore(repo_root=str(tmp_path))
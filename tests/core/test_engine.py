@@ -0,0 +1,73 @@
+import os
+
+import pytest
+from pacta.analyzers.python import PythonAnalyzer
+from pacta.core.config import EngineConfig
+from pacta.core.engine import DefaultPactaEngine
+from pacta.rules.errors import RulesError
+
+RULES = """\
+rule:
+  id: {rule_id}
+  name: No domain to infra
+  severity: error
+  target: dependency
+  when:
+    all:
+      - from.layer == domain
+      - to.layer == infra
+  action: forbid
+  message: Domain must not depend on infra
+"""
+
+
+def _write_rules(path, rule_id, mtime_ns):
+    path.write_text(RULES.format(rule_id=rule_id), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_compile_rules_reuses_ruleset_until_file_changes(tmp_path):
+    rules_file = tmp_path / "rules.pacta.yml"
+    _write_rules(rules_file, "first", 1_000_000_000)
+    engine = DefaultPactaEngine()
+
+    ruleset = engine._compile_rules((rules_file,))
+    assert engine._compile_rules((rules_file,)) is ruleset
+    assert [r.id for r in ruleset.rules] == ["first"]
+
+    _write_rules(rules_file, "second", 2_000_000_000)
+    changed = engine._compile_rules((rules_file,))
+    assert changed is not ruleset
+    assert [r.id for r in changed.rules] == ["second"]
+
+
+def test_compile_rules_does_not_cache_missing_files(tmp_path):
+    engine = DefaultPactaEngine()
+    missing = tmp_path / "missing.pacta.yml"
+
+    with pytest.raises(RulesError):
+        engine._compile_rules((missing,))
+    assert engine._ruleset_cache == {}
+
+
+def test_scan_without_parse_cache_writes_no_cache(tmp_path):
+    (tmp_path / "app.py").write_text("import os\n", encoding="utf-8")
+    engine = DefaultPactaEngine()
+
+    engine.build_ir(EngineConfig(repo_root=tmp_path, model_file=None, rules_files=(), parse_cache=False))
+    assert not (tmp_path / ".pacta" / "cache").exists()
+
+    engine.build_ir(EngineConfig(repo_root=tmp_path, model_file=None, rules_files=()))
+    assert any((tmp_path / ".pacta" / "cache" / "python").rglob("*"))
+
+
+def test_language_options_reach_analyzers(tmp_path, monkeypatch):
+    (tmp_path / "app.py").write_text("import os\n", encoding="utf-8")
+    seen = []
+    monkeypatch.setattr(PythonAnalyzer, "_jobs", lambda self, config: seen.append(config.language_options) or 1)
+
+    options = {"python": {"jobs": 1}}
+    DefaultPactaEngine().build_ir(
+        EngineConfig(repo_root=tmp_path, model_file=None, rules_files=(), language_options=options)
+    )
+    assert seen == [options]
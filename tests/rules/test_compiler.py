@@ -269,6 +269,29 @@ def test_unknown_field_raises_compile_error_when_predicate_runs():
     assert ex.value.details.get("rule_id") == "bad"
 
 
+def test_unknown_dependency_field_raises_compile_error_when_predicate_runs():
+    r = RuleAst(
+        id="bad_dep",
+        name="Bad dependency field",
+        when=DependencyWhenAst(
+            predicate=CompareAst(
+                left=FieldAst(path="from.unknown_field"),
+                op="==",
+                right=lit_str("x"),
+            )
+        ),
+    )
+
+    rule = RulesCompiler().compile(doc_with(r)).rules[0]
+
+    with pytest.raises(RulesCompileError) as ex:
+        rule.when(mk_edge("a", "b"))
+
+    assert "Unknown dependency field" in str(ex.value)
+    assert ex.value.details is not None
+    assert ex.value.details.get("rule_id") == "bad_dep"
+
+
 def test_except_when_target_mismatch_is_compile_error():
     r = RuleAst(
         id="r5",
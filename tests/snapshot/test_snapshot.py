@@ -283,6 +283,30 @@ def test_store_refs_and_objects(tmp_path: Path):
     assert loaded2.schema_version == snap.schema_version
 
 
+def test_store_refs_by_hash_tracks_ref_changes(tmp_path: Path, meta):
+    from pacta.snapshot.builder import DefaultSnapshotBuilder
+    from pacta.snapshot.store import FsSnapshotStore
+
+    store = FsSnapshotStore(repo_root=str(tmp_path))
+    builder = DefaultSnapshotBuilder()
+    first = store.save(builder.build({"nodes": [make_node("a")], "edges": []}, meta=meta), refs=["latest", "baseline"])
+
+    by_hash = store.refs_by_hash()
+    assert sorted(by_hash[first.short_hash]) == ["baseline", "latest"]
+
+    # Editing a returned list must not leak into later calls
+    by_hash[first.short_hash].append("edited")
+    assert sorted(store.refs_by_hash()[first.short_hash]) == ["baseline", "latest"]
+
+    second = store.save(builder.build({"nodes": [make_node("b")], "edges": []}, meta=meta), refs=["latest"])
+    assert store.refs_by_hash() == {first.short_hash: ["baseline"], second.short_hash: ["latest"]}
+
+    # Refs rewritten by another store instance (another process) are picked up too
+    FsSnapshotStore(repo_root=str(tmp_path)).delete_ref("baseline")
+    assert store.refs_by_hash() == {second.short_hash: ["latest"]}
+    assert store.list_refs() == {"latest": second.short_hash}
+
+
 def test_store_save_creates_dirs_and_is_deterministic(tmp_path: Path, meta):
     from pacta.snapshot.builder import DefaultSnapshotBuilder
     from pacta.snapshot.store import FsSnapshotStore
@@ -330,6 +354,34 @@ def test_store_roundtrip_save_load(tmp_path: Path, meta, monkeypatch: pytest.Mon
     assert [e.to_dict() for e in loaded.edges] == [e.to_dict() for e in snap.edges]
 
 
+def test_store_object_stats_come_from_index(tmp_path: Path, meta, monkeypatch: pytest.MonkeyPatch):
+    from dataclasses import replace
+
+    from pacta.snapshot.builder import DefaultSnapshotBuilder
+    from pacta.snapshot.store import FsSnapshotStore
+
+    store = FsSnapshotStore(repo_root=str(tmp_path))
+    ir = {"nodes": [make_node("a"), make_node("b")], "edges": [make_edge("a", "b")]}
+    snap = DefaultSnapshotBuilder().build(ir, meta=meta)
+    short_hash = store.save(snap, refs=["latest"]).short_hash
+
+    # Saving indexed the object: listing stats must not load it
+    real_load = store.load_object
+    monkeypatch.setattr(store, "load_object", lambda h: pytest.fail(f"loaded {h}"))
+    (stats,) = store.list_object_stats()
+    assert (stats.short_hash, stats.branch, stats.commit) == (short_hash, "main", "abc123")
+    assert (stats.node_count, stats.edge_count, stats.violation_count) == (2, 1, 0)
+
+    # An object rewritten behind the store's back is re-read, not served stale
+    monkeypatch.setattr(store, "load_object", real_load)
+    path = store._object_path(short_hash)
+    other = FsSnapshotStore(repo_root=str(tmp_path), index_file="unused.jsonl")
+    other.update_object(short_hash, replace(snap, nodes=snap.nodes[:1], edges=()))
+    assert path.exists()
+    (stats,) = store.list_object_stats()
+    assert (stats.node_count, stats.edge_count) == (1, 0)
+
+
 def test_diff_empty_is_empty(meta):
     from pacta.snapshot.builder import DefaultSnapshotBuilder
     from pacta.snapshot.diff import DefaultSnapshotDiffEngine